@@ -140,12 +140,42 @@ def check_auth():
     return False
 
 
+@st.cache_resource(ttl=30)
+def load_users() -> pd.DataFrame:
+    """Users table shared across reruns without a per-hit copy.
+
+    The returned DataFrame is shared; callers must ``.copy()`` before mutating.
+    """
+    return db.get_users()
+
+
+@st.cache_resource(ttl=30)
+def load_sessions() -> pd.DataFrame:
+    """Sessions table shared across reruns without a per-hit copy.
+
+    The returned DataFrame is shared; callers must ``.copy()`` before mutating.
+    """
+    return db.get_sessions()
+
+
+@st.cache_data(ttl=30)
+def load_stats() -> dict:
+    """Overview totals, cached so reruns don't recount."""
+    return db.get_stats()
+
+
+@st.cache_data(ttl=30)
+def load_table_info() -> dict:
+    """Table catalog and row counts for the schema page."""
+    return db.get_table_info()
+
+
 def show_overview():
     t = get_translator()
     st.header(t("overview.header"))
 
     try:
-        stats = db.get_stats()
+        stats = load_stats()
 
         col1, col2, col3 = st.columns(3)
         col1.metric(t("overview.total_users"), stats["total_users"])
@@ -161,7 +191,7 @@ def show_users():
     st.header(t("users.header"))
 
     try:
-        users_df = db.get_users()
+        users_df = load_users()
 
         if users_df.empty:
             st.info(t("users.no_users"))
@@ -193,6 +223,8 @@ def show_users():
                 st.write(f"**{t('users.actions')}**")
                 if st.button(t("users.revoke_all_sessions"), key="revoke_all"):
                     count = db.revoke_all_user_sessions(selected_user)
+                    load_users.clear()
+                    load_sessions.clear()
                     st.success(t("users.revoked_sessions", count=count))
                     st.rerun()
 
@@ -205,7 +237,7 @@ def show_sessions():
     st.header(t("sessions.header"))
 
     try:
-        sessions_df = db.get_sessions()
+        sessions_df = load_sessions()
 
         if sessions_df.empty:
             st.info(t("sessions.no_sessions"))
@@ -239,6 +271,8 @@ def show_sessions():
             selected_session = st.selectbox(t("sessions.select_session"), session_ids)
             if st.button(t("sessions.revoke_selected")):
                 db.revoke_session(selected_session)
+                load_users.clear()
+                load_sessions.clear()
                 st.success(t("sessions.session_revoked"))
                 st.rerun()
 
@@ -673,12 +707,27 @@ def show_api_test():
                 st.error(f"{t('api_test.error')}: {e}")
 
 
+@st.cache_data
+def build_schema_stats(table_info: dict) -> pd.DataFrame:
+    """Build per-table row and column counts for the statistics tab."""
+    return (
+        pd.DataFrame.from_dict(
+            {name: (info["row_count"], len(info["columns"])) for name, info in table_info.items()},
+            orient="index",
+            columns=["Rows", "Columns"],
+        )
+        .rename_axis("Table")
+        .reset_index()
+        .sort_values("Rows", ascending=False)
+    )
+
+
 def show_db_schema():
     t = get_translator()
     st.header(t("db_schema.header"))
 
     try:
-        table_info = db.get_table_info()
+        table_info = load_table_info()
         relationships = db.get_table_relationships()
 
         # Tab layout
@@ -696,15 +745,12 @@ def show_db_schema():
             # Add tables as nodes
             for table_name, info in table_info.items():
                 # Build label with columns
-                pk_cols = set(info["primary_keys"])
-                fk_cols = {fk["column"] for fk in info["foreign_keys"]}
-                
                 cols_str = ""
                 for col in info["columns"]:
                     prefix = ""
-                    if col["name"] in pk_cols:
+                    if col["pk"]:
                         prefix = "🔑 "
-                    elif col["name"] in fk_cols:
+                    elif col["fk"]:
                         prefix = "🔗 "
                     cols_str += f"{prefix}{col['name']}: {col['type']}\\l"
                 
@@ -760,10 +806,7 @@ def show_db_schema():
 
                 with col1:
                     st.write(f"**{t('db_schema.columns')}**")
-                    cols_df = pd.DataFrame(info["columns"])
-                    cols_df["PK"] = cols_df["name"].isin(info["primary_keys"])
-                    fk_cols = {fk["column"] for fk in info["foreign_keys"]}
-                    cols_df["FK"] = cols_df["name"].isin(fk_cols)
+                    cols_df = pd.DataFrame(info["columns"]).rename(columns={"pk": "PK", "fk": "FK"})
                     st.dataframe(cols_df, hide_index=True, use_container_width=True)
 
                 with col2:
@@ -778,9 +821,11 @@ def show_db_schema():
         with tab3:
             st.subheader(t("db_schema.db_statistics"))
 
+            stats_df = build_schema_stats(table_info)
+
             # Summary metrics
             total_tables = len(table_info)
-            total_rows = sum(info["row_count"] for info in table_info.values())
+            total_rows = int(stats_df["Rows"].sum())
             total_relationships = len(relationships)
 
             col1, col2, col3 = st.columns(3)
@@ -792,11 +837,6 @@ def show_db_schema():
 
             # Row counts per table
             st.write(f"**{t('db_schema.rows_per_table')}**")
-            stats_data = [
-                {"Table": name, "Rows": info["row_count"], "Columns": len(info["columns"])}
-                for name, info in table_info.items()
-            ]
-            stats_df = pd.DataFrame(stats_data).sort_values("Rows", ascending=False)
             st.dataframe(stats_df, hide_index=True, use_container_width=True)
 
             # Bar chart
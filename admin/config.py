@@ -1,13 +1,18 @@
 """Admin configuration."""
 import os
+from functools import lru_cache
+from pathlib import Path
 
 
+@lru_cache(maxsize=None)
 def read_secret(name: str, default: str = "") -> str:
-    """Read secret from Docker secrets or environment variable."""
-    secret_path = f"/run/secrets/{name}"
-    if os.path.exists(secret_path):
-        with open(secret_path, "r") as f:
-            return f.read().strip()
+    """Read secret from Docker secrets or environment variable.
+
+    Secrets don't change during the process lifetime, so results are cached.
+    """
+    secret_path = Path(f"/run/secrets/{name}")
+    if secret_path.exists():
+        return secret_path.read_text().strip()
     return os.getenv(name.upper(), default)
 
 
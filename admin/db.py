@@ -6,29 +6,112 @@ import pandas as pd
 
 from config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+# Streamlit serves several users from one process; keep enough warm
+# connections around and drop ones the server may have closed.
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_size=10,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 Session = sessionmaker(bind=engine)
 
+# Frequently used statements are built once so SQLAlchemy's compiled
+# cache is hit on every page render.
+USERS_QUERY = text("""
+    SELECT 
+        u.id,
+        ue.email,
+        up.display_name,
+        u.created_at,
+        up.updated_at,
+        COUNT(DISTINCT oa.id) as oauth_accounts,
+        COUNT(DISTINCT rt.id) FILTER (WHERE rt.is_revoked = false AND rt.expires_at > NOW()) as active_sessions
+    FROM users u
+    LEFT JOIN user_emails ue ON u.id = ue.user_id AND ue.is_primary = true
+    LEFT JOIN user_profiles up ON u.id = up.user_id
+    LEFT JOIN oauth_accounts oa ON u.id = oa.user_id
+    LEFT JOIN refresh_tokens rt ON u.id = rt.user_id
+    GROUP BY u.id, ue.email, up.display_name, up.updated_at
+    ORDER BY u.created_at DESC
+""")
+
+STATS_QUERY = text("""
+    SELECT
+        (SELECT COUNT(*) FROM users) AS total_users,
+        (SELECT COUNT(*) FROM oauth_accounts) AS total_oauth_accounts,
+        (SELECT COUNT(*) FROM refresh_tokens
+         WHERE is_revoked = false AND expires_at > NOW()) AS active_sessions
+""")
+
+_SESSIONS_BASE = """
+    SELECT 
+        rt.id,
+        ue.email,
+        rt.device_info,
+        rt.ip_address,
+        rt.is_revoked,
+        rt.expires_at,
+        rt.created_at,
+        rt.last_used_at
+    FROM refresh_tokens rt
+    JOIN users u ON rt.user_id = u.id
+    LEFT JOIN user_emails ue ON u.id = ue.user_id AND ue.is_primary = true
+"""
+SESSIONS_QUERY = text(_SESSIONS_BASE + " ORDER BY rt.created_at DESC LIMIT 100")
+USER_SESSIONS_QUERY = text(
+    _SESSIONS_BASE + " WHERE rt.user_id = :user_id ORDER BY rt.created_at DESC LIMIT 100"
+)
+
+TABLES_QUERY = text("""
+    SELECT table_name 
+    FROM information_schema.tables 
+    WHERE table_schema = 'public' 
+    AND table_type = 'BASE TABLE'
+    ORDER BY table_name
+""")
+
+COLUMNS_QUERY = text("""
+    SELECT 
+        column_name,
+        data_type,
+        is_nullable,
+        column_default
+    FROM information_schema.columns
+    WHERE table_schema = 'public' AND table_name = :table
+    ORDER BY ordinal_position
+""")
+
+PRIMARY_KEYS_QUERY = text("""
+    SELECT kcu.column_name
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu 
+        ON tc.constraint_name = kcu.constraint_name
+    WHERE tc.table_schema = 'public' 
+        AND tc.table_name = :table 
+        AND tc.constraint_type = 'PRIMARY KEY'
+""")
+
+FOREIGN_KEYS_QUERY = text("""
+    SELECT 
+        kcu.column_name,
+        ccu.table_name AS foreign_table,
+        ccu.column_name AS foreign_column
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu 
+        ON tc.constraint_name = kcu.constraint_name
+    JOIN information_schema.constraint_column_usage ccu 
+        ON tc.constraint_name = ccu.constraint_name
+    WHERE tc.table_schema = 'public' 
+        AND tc.table_name = :table 
+        AND tc.constraint_type = 'FOREIGN KEY'
+""")
+
 
 def get_users() -> pd.DataFrame:
     with Session() as session:
-        result = session.execute(text("""
-            SELECT 
-                u.id,
-                ue.email,
-                up.display_name,
-                u.created_at,
-                up.updated_at,
-                COUNT(DISTINCT oa.id) as oauth_accounts,
-                COUNT(DISTINCT rt.id) FILTER (WHERE rt.is_revoked = false AND rt.expires_at > NOW()) as active_sessions
-            FROM users u
-            LEFT JOIN user_emails ue ON u.id = ue.user_id AND ue.is_primary = true
-            LEFT JOIN user_profiles up ON u.id = up.user_id
-            LEFT JOIN oauth_accounts oa ON u.id = oa.user_id
-            LEFT JOIN refresh_tokens rt ON u.id = rt.user_id
-            GROUP BY u.id, ue.email, up.display_name, up.updated_at
-            ORDER BY u.created_at DESC
-        """))
+        result = session.execute(USERS_QUERY)
         rows = result.fetchall()
         return pd.DataFrame(rows, columns=[
             "ID", "Email", "Display Name", "Created At", "Updated At", 
@@ -50,27 +133,10 @@ def get_user_oauth_accounts(user_id: str) -> pd.DataFrame:
 
 def get_sessions(user_id: Optional[str] = None) -> pd.DataFrame:
     with Session() as session:
-        query = """
-            SELECT 
-                rt.id,
-                ue.email,
-                rt.device_info,
-                rt.ip_address,
-                rt.is_revoked,
-                rt.expires_at,
-                rt.created_at,
-                rt.last_used_at
-            FROM refresh_tokens rt
-            JOIN users u ON rt.user_id = u.id
-            LEFT JOIN user_emails ue ON u.id = ue.user_id AND ue.is_primary = true
-        """
-        params = {}
         if user_id:
-            query += " WHERE rt.user_id = :user_id"
-            params["user_id"] = user_id
-        query += " ORDER BY rt.created_at DESC LIMIT 100"
-        
-        result = session.execute(text(query), params)
+            result = session.execute(USER_SESSIONS_QUERY, {"user_id": user_id})
+        else:
+            result = session.execute(SESSIONS_QUERY)
         rows = result.fetchall()
         return pd.DataFrame(rows, columns=[
             "ID", "User Email", "Device", "IP Address", 
@@ -100,17 +166,13 @@ def revoke_all_user_sessions(user_id: str) -> int:
 
 
 def get_stats() -> dict:
+    """Overview totals in one round trip."""
     with Session() as session:
-        users = session.execute(text("SELECT COUNT(*) FROM users"))
-        oauth = session.execute(text("SELECT COUNT(*) FROM oauth_accounts"))
-        active_sessions = session.execute(text("""
-            SELECT COUNT(*) FROM refresh_tokens 
-            WHERE is_revoked = false AND expires_at > NOW()
-        """))
+        row = session.execute(STATS_QUERY).one()
         return {
-            "total_users": users.scalar(),
-            "total_oauth_accounts": oauth.scalar(),
-            "active_sessions": active_sessions.scalar(),
+            "total_users": row.total_users,
+            "total_oauth_accounts": row.total_oauth_accounts,
+            "active_sessions": row.active_sessions,
         }
 
 
@@ -138,65 +200,17 @@ def get_table_info() -> dict:
     """Get detailed information about all tables."""
     with Session() as session:
         # Get all tables
-        tables_result = session.execute(text("""
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_type = 'BASE TABLE'
-            ORDER BY table_name
-        """))
+        tables_result = session.execute(TABLES_QUERY)
         tables = [row[0] for row in tables_result.fetchall()]
         
         table_info = {}
         for table in tables:
-            # Get columns
-            cols_result = session.execute(text("""
-                SELECT 
-                    column_name,
-                    data_type,
-                    is_nullable,
-                    column_default
-                FROM information_schema.columns
-                WHERE table_schema = 'public' AND table_name = :table
-                ORDER BY ordinal_position
-            """), {"table": table})
-            
-            columns = []
-            for row in cols_result.fetchall():
-                columns.append({
-                    "name": row[0],
-                    "type": row[1],
-                    "nullable": row[2] == "YES",
-                    "default": row[3],
-                })
-            
             # Get primary keys
-            pk_result = session.execute(text("""
-                SELECT kcu.column_name
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu 
-                    ON tc.constraint_name = kcu.constraint_name
-                WHERE tc.table_schema = 'public' 
-                    AND tc.table_name = :table 
-                    AND tc.constraint_type = 'PRIMARY KEY'
-            """), {"table": table})
+            pk_result = session.execute(PRIMARY_KEYS_QUERY, {"table": table})
             primary_keys = [row[0] for row in pk_result.fetchall()]
             
             # Get foreign keys
-            fk_result = session.execute(text("""
-                SELECT 
-                    kcu.column_name,
-                    ccu.table_name AS foreign_table,
-                    ccu.column_name AS foreign_column
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu 
-                    ON tc.constraint_name = kcu.constraint_name
-                JOIN information_schema.constraint_column_usage ccu 
-                    ON tc.constraint_name = ccu.constraint_name
-                WHERE tc.table_schema = 'public' 
-                    AND tc.table_name = :table 
-                    AND tc.constraint_type = 'FOREIGN KEY'
-            """), {"table": table})
+            fk_result = session.execute(FOREIGN_KEYS_QUERY, {"table": table})
             foreign_keys = []
             for row in fk_result.fetchall():
                 foreign_keys.append({
@@ -205,6 +219,23 @@ def get_table_info() -> dict:
                     "references_column": row[2],
                 })
             
+            # Get columns, flagging key membership once here so the
+            # schema page doesn't recompute it on every render
+            cols_result = session.execute(COLUMNS_QUERY, {"table": table})
+            pk_cols = set(primary_keys)
+            fk_cols = {fk["column"] for fk in foreign_keys}
+            
+            columns = []
+            for row in cols_result.fetchall():
+                columns.append({
+                    "name": row[0],
+                    "type": row[1],
+                    "nullable": row[2] == "YES",
+                    "default": row[3],
+                    "pk": row[0] in pk_cols,
+                    "fk": row[0] in fk_cols,
+                })
+            
             # Get row count
             count_result = session.execute(text(f'SELECT COUNT(*) FROM "{table}"'))
             row_count = count_result.scalar()
@@ -1,59 +1,52 @@
 """Valkey operations for admin."""
-import asyncio
 import json
-import redis.asyncio as redis
+import redis
 from config import settings
 
+# Streamlit reruns are serial, so a sync client with its own pool is enough
+_client = redis.Redis.from_url(settings.VALKEY_URL, decode_responses=True)
 
-def run_async(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
-async def _get_oauth_states() -> list[dict]:
-    client = redis.from_url(settings.VALKEY_URL, decode_responses=True)
-    try:
-        keys = await client.keys("oauth_state:*")
-        states = []
-        for key in keys:
-            ttl = await client.ttl(key)
-            value = await client.get(key)
-            data = json.loads(value) if value else {}
-            states.append({
-                "state": key.replace("oauth_state:", "")[:16] + "...",
-                "provider": data.get("provider", "unknown"),
-                "has_pkce": "code_verifier" in data,
-                "ttl_seconds": ttl,
-            })
-        return states
-    finally:
-        await client.close()
-
-
-async def _get_rate_limit_info() -> list[dict]:
-    client = redis.from_url(settings.VALKEY_URL, decode_responses=True)
-    try:
-        keys = await client.keys("LIMITER:*")
-        limits = []
-        for key in keys:
-            ttl = await client.ttl(key)
-            value = await client.get(key)
-            limits.append({
-                "key": key,
-                "count": value,
-                "ttl_seconds": ttl,
-            })
-        return limits
-    finally:
-        await client.close()
+# Keys requested per SCAN round trip
+SCAN_COUNT = 1000
+
+
+def _scan_values(pattern: str) -> list[tuple[str, int, str | None]]:
+    """Collect (key, ttl, value) for string keys matching pattern.
+
+    Uses incremental SCAN instead of KEYS so the server is never blocked,
+    and fetches TTL+GET for each SCAN batch in a single pipeline.
+    """
+    entries = []
+    cursor = 0
+    while True:
+        cursor, keys = _client.scan(cursor, match=pattern, count=SCAN_COUNT, _type="string")
+        if keys:
+            pipe = _client.pipeline(transaction=False)
+            for key in keys:
+                pipe.ttl(key)
+                pipe.get(key)
+            results = pipe.execute()
+            for i, key in enumerate(keys):
+                entries.append((key, results[2 * i], results[2 * i + 1]))
+        if cursor == 0:
+            return entries
 
 
 def get_oauth_states() -> list[dict]:
-    return run_async(_get_oauth_states())
+    states = []
+    for key, ttl, value in _scan_values("oauth_state:*"):
+        data = json.loads(value) if value else {}
+        states.append({
+            "state": key.replace("oauth_state:", "")[:16] + "...",
+            "provider": data.get("provider", "unknown"),
+            "has_pkce": "code_verifier" in data,
+            "ttl_seconds": ttl,
+        })
+    return states
 
 
 def get_rate_limit_info() -> list[dict]:
-    return run_async(_get_rate_limit_info())
+    return [
+        {"key": key, "count": value, "ttl_seconds": ttl}
+        for key, ttl, value in _scan_values("LIMITER:*")
+    ]
@@ -0,0 +1,36 @@
+"""Add covering user_id index to oauth_accounts.
+
+Lets the linked accounts listing run as an index-only scan.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_oauth_accounts_user_id_covering",
+        "oauth_accounts",
+        ["user_id"],
+        postgresql_include=[
+            "id",
+            "provider",
+            "provider_user_id",
+            "provider_display_name",
+            "provider_avatar_url",
+            "provider_email",
+            "created_at",
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_oauth_accounts_user_id_covering", table_name="oauth_accounts")
@@ -0,0 +1,37 @@
+"""Maintain user_profiles.updated_at with a trigger.
+
+Keeps updated_at current for updates that don't go through the ORM.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION touch_updated_at()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = NOW();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_touch_user_profiles
+        BEFORE UPDATE ON user_profiles
+        FOR EACH ROW EXECUTE FUNCTION touch_updated_at()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_touch_user_profiles ON user_profiles")
+    op.execute("DROP FUNCTION IF EXISTS touch_updated_at()")
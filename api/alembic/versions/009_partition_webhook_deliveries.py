@@ -0,0 +1,221 @@
+"""Partition webhook_deliveries by month.
+
+- Monthly range partitions on created_at with 90-day retention
+- id defaults to gen_random_uuid() server-side
+- pg_cron job for partition management
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+# Retention period in days
+RETENTION_DAYS = 90
+
+COLUMNS = (
+    "id, event_id, event_type, endpoint_id, endpoint_url, status, http_status, "
+    "error_message, attempt_count, latency_ms, created_at, completed_at"
+)
+
+INDEXED_COLUMNS = ("event_id", "event_type", "endpoint_id", "created_at")
+
+
+def upgrade() -> None:
+    # Move the unpartitioned table aside so its name and index names are free
+    op.execute("ALTER TABLE webhook_deliveries RENAME TO webhook_deliveries_old")
+    op.execute(
+        "ALTER TABLE webhook_deliveries_old "
+        "RENAME CONSTRAINT webhook_deliveries_pkey TO webhook_deliveries_old_pkey"
+    )
+    for column in INDEXED_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_webhook_deliveries_{column}")
+
+    op.execute("""
+        CREATE TABLE webhook_deliveries (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            event_id UUID NOT NULL,
+            event_type VARCHAR(50) NOT NULL,
+            endpoint_id VARCHAR(100) NOT NULL,
+            endpoint_url VARCHAR(500) NOT NULL,
+            status VARCHAR(20) NOT NULL DEFAULT 'pending',
+            http_status INTEGER,
+            error_message TEXT,
+            attempt_count INTEGER NOT NULL DEFAULT 0,
+            latency_ms INTEGER,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            completed_at TIMESTAMPTZ,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    # Create indexes (propagated to every partition, including future ones)
+    # created_at is append-only and time-ordered, so BRIN replaces the B-tree
+    op.execute("CREATE INDEX ix_webhook_deliveries_event_id ON webhook_deliveries (event_id)")
+    op.execute("CREATE INDEX ix_webhook_deliveries_event_type ON webhook_deliveries (event_type)")
+    op.execute("CREATE INDEX ix_webhook_deliveries_endpoint_id ON webhook_deliveries (endpoint_id)")
+    op.execute(
+        "CREATE INDEX ix_webhook_deliveries_created_at ON webhook_deliveries "
+        "USING BRIN (created_at) WITH (pages_per_range = 32)"
+    )
+
+    # Create partitions covering existing rows (or the previous month for
+    # safety, whichever is older) through 3 months ahead
+    op.execute("""
+        DO $$
+        DECLARE
+            m DATE;
+        BEGIN
+            FOR m IN
+                SELECT generate_series(
+                    LEAST(
+                        (SELECT DATE_TRUNC('month', MIN(created_at)) FROM webhook_deliveries_old),
+                        DATE_TRUNC('month', CURRENT_DATE) - '1 month'::INTERVAL
+                    ),
+                    DATE_TRUNC('month', CURRENT_DATE) + '3 months'::INTERVAL,
+                    '1 month'::INTERVAL
+                )
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS webhook_deliveries_%s PARTITION OF webhook_deliveries FOR VALUES FROM (%L) TO (%L)',
+                    TO_CHAR(m, 'YYYY_MM'), m, m + '1 month'::INTERVAL
+                );
+            END LOOP;
+        END $$;
+    """)
+
+    op.execute(
+        f"INSERT INTO webhook_deliveries ({COLUMNS}) SELECT {COLUMNS} FROM webhook_deliveries_old"
+    )
+    op.execute("DROP TABLE webhook_deliveries_old")
+
+    # Create function to manage partitions
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION manage_webhook_partitions()
+        RETURNS void AS $$
+        DECLARE
+            partition_date DATE;
+            partition_name TEXT;
+            drop_date DATE;
+            table_name TEXT;
+        BEGIN
+            -- Create partitions for next 3 months
+            FOR i IN 0..3 LOOP
+                partition_date := DATE_TRUNC('month', CURRENT_DATE + (i || ' months')::INTERVAL);
+                partition_name := TO_CHAR(partition_date, 'YYYY_MM');
+
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_tables
+                    WHERE schemaname = 'public'
+                    AND tablename = 'webhook_deliveries_' || partition_name
+                ) THEN
+                    EXECUTE format(
+                        'CREATE TABLE webhook_deliveries_%s PARTITION OF webhook_deliveries FOR VALUES FROM (%L) TO (%L)',
+                        partition_name, partition_date, partition_date + '1 month'::INTERVAL
+                    );
+                END IF;
+            END LOOP;
+
+            -- Drop partitions whose whole month is past the retention period
+            drop_date := CURRENT_DATE - '{RETENTION_DAYS} days'::INTERVAL;
+
+            -- Dropping a partition locks the parent ACCESS EXCLUSIVE. Bound the wait
+            -- so a long-running query can't park the lock in front of inserts;
+            -- a partition that can't be locked in time is retried on the next run
+            PERFORM set_config('lock_timeout', '2s', true);
+
+            FOR table_name IN
+                SELECT tablename FROM pg_tables
+                WHERE schemaname = 'public'
+                AND tablename ~ '^webhook_deliveries_[0-9]{{4}}_[0-9]{{2}}$'
+            LOOP
+                IF TO_DATE(SUBSTRING(table_name FROM '[0-9]{{4}}_[0-9]{{2}}$'), 'YYYY_MM')
+                        + '1 month'::INTERVAL <= drop_date THEN
+                    BEGIN
+                        EXECUTE format('DROP TABLE IF EXISTS %I', table_name);
+                        RAISE NOTICE 'Dropped partition: %', table_name;
+                    EXCEPTION WHEN lock_not_available THEN
+                        RAISE NOTICE 'Partition % busy, retrying next run', table_name;
+                    END;
+                END IF;
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # Schedule pg_cron job (runs daily at 2:30 AM)
+    # Skip if pg_cron extension is not available (e.g., CI environment)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.schedule(
+                    'webhook_partition_management',
+                    '30 2 * * *',
+                    'SELECT manage_webhook_partitions()'
+                );
+            END IF;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    # Remove pg_cron job (if pg_cron is available)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.unschedule('webhook_partition_management');
+            END IF;
+        END $$;
+    """)
+
+    op.execute("DROP FUNCTION IF EXISTS manage_webhook_partitions()")
+
+    # Move the partitioned table aside and restore the 006 layout
+    op.execute("ALTER TABLE webhook_deliveries RENAME TO webhook_deliveries_partitioned")
+    op.execute(
+        "ALTER TABLE webhook_deliveries_partitioned "
+        "RENAME CONSTRAINT webhook_deliveries_pkey TO webhook_deliveries_partitioned_pkey"
+    )
+    for column in INDEXED_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_webhook_deliveries_{column}")
+
+    op.create_table(
+        "webhook_deliveries",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False, index=True),
+        sa.Column("event_type", sa.String(50), nullable=False, index=True),
+        sa.Column("endpoint_id", sa.String(100), nullable=False, index=True),
+        sa.Column("endpoint_url", sa.String(500), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("http_status", sa.Integer, nullable=True),
+        sa.Column("error_message", sa.Text, nullable=True),
+        sa.Column("attempt_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("latency_ms", sa.Integer, nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+            index=True,
+        ),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    op.execute(
+        f"INSERT INTO webhook_deliveries ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM webhook_deliveries_partitioned"
+    )
+
+    # Dropping the parent drops all partitions
+    op.execute("DROP TABLE webhook_deliveries_partitioned")
@@ -0,0 +1,35 @@
+"""Use BRIN indexes for audit created_at columns.
+
+audit.login_history and audit.auth_events are append-only and ordered by
+created_at, so BRIN is far smaller and cheaper to maintain on insert than
+a B-tree.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+TABLES = ("login_history", "auth_events")
+
+
+def upgrade() -> None:
+    # Indexes on the partitioned parent propagate to every partition
+    for table in TABLES:
+        op.execute(f"DROP INDEX IF EXISTS audit.idx_{table}_created_at")
+        op.execute(
+            f"CREATE INDEX idx_{table}_created_at ON audit.{table} "
+            "USING BRIN (created_at) WITH (pages_per_range = 32)"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP INDEX IF EXISTS audit.idx_{table}_created_at")
+        op.execute(f"CREATE INDEX idx_{table}_created_at ON audit.{table} (created_at)")
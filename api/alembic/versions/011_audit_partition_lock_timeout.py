@@ -0,0 +1,152 @@
+"""Bound the lock wait when audit.manage_partitions() drops partitions.
+
+Dropping an expired partition locks the parent ACCESS EXCLUSIVE. The
+retention sweep now sets a short lock_timeout and skips a partition it
+can't lock in time; it is retried on the next run.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION audit.manage_partitions()
+        RETURNS void AS $$
+        DECLARE
+            partition_date DATE;
+            partition_name TEXT;
+            start_date DATE;
+            end_date DATE;
+            drop_date DATE;
+            table_name TEXT;
+        BEGIN
+            -- Create partitions for next 3 months
+            FOR i IN 0..3 LOOP
+                partition_date := DATE_TRUNC('month', CURRENT_DATE + (i || ' months')::INTERVAL);
+                partition_name := TO_CHAR(partition_date, 'YYYY_MM');
+                start_date := partition_date;
+                end_date := partition_date + '1 month'::INTERVAL;
+
+                -- login_history
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_tables
+                    WHERE schemaname = 'audit'
+                    AND tablename = 'login_history_' || partition_name
+                ) THEN
+                    EXECUTE format(
+                        'CREATE TABLE audit.login_history_%s PARTITION OF audit.login_history FOR VALUES FROM (%L) TO (%L)',
+                        partition_name, start_date, end_date
+                    );
+                END IF;
+
+                -- auth_events
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_tables
+                    WHERE schemaname = 'audit'
+                    AND tablename = 'auth_events_' || partition_name
+                ) THEN
+                    EXECUTE format(
+                        'CREATE TABLE audit.auth_events_%s PARTITION OF audit.auth_events FOR VALUES FROM (%L) TO (%L)',
+                        partition_name, start_date, end_date
+                    );
+                END IF;
+            END LOOP;
+
+            -- Drop partitions older than retention period (36 months)
+            drop_date := DATE_TRUNC('month', CURRENT_DATE - '36 months'::INTERVAL);
+
+            -- Dropping a partition locks the parent ACCESS EXCLUSIVE. Bound the wait
+            -- so a long-running query can't park the lock in front of inserts;
+            -- a partition that can't be locked in time is retried on the next run
+            PERFORM set_config('lock_timeout', '2s', true);
+
+            FOR table_name IN
+                SELECT tablename FROM pg_tables
+                WHERE schemaname = 'audit'
+                AND (tablename LIKE 'login_history_%' OR tablename LIKE 'auth_events_%')
+            LOOP
+                -- Extract date from partition name
+                IF TO_DATE(SUBSTRING(table_name FROM '[0-9]{4}_[0-9]{2}$'), 'YYYY_MM') < drop_date THEN
+                    BEGIN
+                        EXECUTE format('DROP TABLE IF EXISTS audit.%I', table_name);
+                        RAISE NOTICE 'Dropped partition: %', table_name;
+                    EXCEPTION WHEN lock_not_available THEN
+                        RAISE NOTICE 'Partition % busy, retrying next run', table_name;
+                    END;
+                END IF;
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION audit.manage_partitions()
+        RETURNS void AS $$
+        DECLARE
+            partition_date DATE;
+            partition_name TEXT;
+            start_date DATE;
+            end_date DATE;
+            drop_date DATE;
+            table_name TEXT;
+        BEGIN
+            -- Create partitions for next 3 months
+            FOR i IN 0..3 LOOP
+                partition_date := DATE_TRUNC('month', CURRENT_DATE + (i || ' months')::INTERVAL);
+                partition_name := TO_CHAR(partition_date, 'YYYY_MM');
+                start_date := partition_date;
+                end_date := partition_date + '1 month'::INTERVAL;
+
+                -- login_history
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_tables
+                    WHERE schemaname = 'audit'
+                    AND tablename = 'login_history_' || partition_name
+                ) THEN
+                    EXECUTE format(
+                        'CREATE TABLE audit.login_history_%s PARTITION OF audit.login_history FOR VALUES FROM (%L) TO (%L)',
+                        partition_name, start_date, end_date
+                    );
+                END IF;
+
+                -- auth_events
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_tables
+                    WHERE schemaname = 'audit'
+                    AND tablename = 'auth_events_' || partition_name
+                ) THEN
+                    EXECUTE format(
+                        'CREATE TABLE audit.auth_events_%s PARTITION OF audit.auth_events FOR VALUES FROM (%L) TO (%L)',
+                        partition_name, start_date, end_date
+                    );
+                END IF;
+            END LOOP;
+
+            -- Drop partitions older than retention period (36 months)
+            drop_date := DATE_TRUNC('month', CURRENT_DATE - '36 months'::INTERVAL);
+
+            FOR table_name IN
+                SELECT tablename FROM pg_tables
+                WHERE schemaname = 'audit'
+                AND (tablename LIKE 'login_history_%' OR tablename LIKE 'auth_events_%')
+            LOOP
+                -- Extract date from partition name
+                IF TO_DATE(SUBSTRING(table_name FROM '[0-9]{4}_[0-9]{2}$'), 'YYYY_MM') < drop_date THEN
+                    EXECUTE format('DROP TABLE IF EXISTS audit.%I', table_name);
+                    RAISE NOTICE 'Dropped partition: %', table_name;
+                END IF;
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
@@ -1,19 +1,22 @@
 """OAuth account linking/unlinking router."""
 
+import asyncio
 import secrets
+import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
-from sqlalchemy import func, select
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.jwt import get_current_user
+from app.auth.jwt import CurrentUser, get_current_user
 from app.auth.oauth import DiscordOAuth, GoogleOAuth
 from app.auth.pkce import generate_code_challenge, generate_code_verifier
 from app.config import get_settings
 from app.db.session import get_db
-from app.models import OAuthAccount, User
-from app.valkey import OAuthStateStore
+from app.models import OAuthAccount
+from app.valkey import LinkedAccountsCache, OAuthStateStore
 
 from .schemas import OAuthAccountResponse, UnlinkResponse
 
@@ -23,26 +26,130 @@ router = APIRouter(prefix="/accounts", tags=["accounts"])
 # API prefix for building URLs
 API_V1_PREFIX = "/api/v1"
 
+# Link callback URLs and frontend redirect targets, built once
+_LINK_BASE_URL = f"{settings.API_URL}{API_V1_PREFIX}/accounts/link"
+GOOGLE_LINK_REDIRECT_URI = f"{_LINK_BASE_URL}/google/callback"
+DISCORD_LINK_REDIRECT_URI = f"{_LINK_BASE_URL}/discord/callback"
+ACCOUNTS_SETTINGS_URL = f"{settings.FRONTEND_URL}/settings/accounts"
+ALREADY_LINKED_URL = f"{ACCOUNTS_SETTINGS_URL}?status=already_linked"
+
+# Providers that can be linked to an existing account
+SUPPORTED_PROVIDERS: frozenset[str] = frozenset(("google", "discord"))
+
+# Deletes the provider's account only if another login method remains.
+# Locking the user's rows first makes concurrent unlinks of different
+# providers take turns, so the second one counts what the first left behind.
+_UNLINK_ACCOUNT = text(
+    """
+    WITH locked AS (
+        SELECT id FROM oauth_accounts WHERE user_id = :user_id FOR UPDATE
+    ),
+    cnt AS (
+        SELECT count(*) AS c FROM locked
+    ),
+    del AS (
+        DELETE FROM oauth_accounts
+        WHERE user_id = :user_id
+          AND provider = :provider
+          AND (SELECT c FROM cnt) > 1
+        RETURNING provider
+    )
+    SELECT (SELECT c FROM cnt), (SELECT provider FROM del)
+    """
+)
+
+
+async def _own_provider_user_ids(db: AsyncSession, user_id: str, provider: str) -> set[str]:
+    """Provider user IDs already linked to this user for a provider."""
+    result = await db.execute(
+        select(OAuthAccount.provider_user_id).where(
+            OAuthAccount.user_id == uuid.UUID(user_id),
+            OAuthAccount.provider == provider,
+        )
+    )
+    return set(result.scalars())
+
 
-@router.get("", response_model=list[OAuthAccountResponse])
+async def _link_oauth_account(
+    db: AsyncSession,
+    user_id: str,
+    provider: str,
+    user_info: dict,
+    token_data: dict,
+) -> uuid.UUID | None:
+    """Link a provider account to a user and commit.
+
+    Relies on the unique (provider, provider_user_id) index, so the insert
+    and the "already linked" check are one statement. Returns None when the
+    link was created, otherwise the user the account already belongs to.
+    """
+    result = await db.execute(
+        insert(OAuthAccount)
+        .values(
+            user_id=uuid.UUID(user_id),
+            provider=provider,
+            provider_user_id=user_info["id"],
+            access_token=token_data["access_token"],
+            refresh_token=token_data.get("refresh_token"),
+        )
+        .on_conflict_do_nothing(index_elements=["provider", "provider_user_id"])
+        .returning(OAuthAccount.user_id)
+    )
+    if result.scalar_one_or_none() is not None:
+        await db.commit()
+        return None
+
+    existing = await db.execute(
+        select(OAuthAccount.user_id).where(
+            OAuthAccount.provider == provider,
+            OAuthAccount.provider_user_id == user_info["id"],
+        )
+    )
+    return existing.scalar_one()
+
+
+# Items are built with model_construct and cached already serialized, so skip
+# FastAPI's response validation while keeping the schema in the OpenAPI docs
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": list[OAuthAccountResponse]}},
+)
 async def list_linked_accounts(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """List all OAuth accounts linked to current user."""
-    result = await db.execute(select(OAuthAccount).where(OAuthAccount.user_id == current_user.id))
-    accounts = result.scalars().all()
-    return accounts
+
+    async def load() -> list[dict]:
+        result = await db.execute(
+            select(
+                OAuthAccount.id,
+                OAuthAccount.provider,
+                OAuthAccount.provider_user_id,
+                OAuthAccount.provider_display_name,
+                OAuthAccount.provider_avatar_url,
+                OAuthAccount.provider_email,
+                OAuthAccount.created_at,
+            ).where(OAuthAccount.user_id == current_user.id)
+        )
+        # Rows come straight from our own table, so skip validation here
+        return [
+            OAuthAccountResponse.model_construct(**row._mapping).model_dump(mode="json")
+            for row in result
+        ]
+
+    return await LinkedAccountsCache.get_or_set(current_user.id, load)
 
 
 @router.get("/link/{provider}")
 async def start_link_account(
     provider: str,
     request: Request,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Start OAuth flow to link a new provider to existing account."""
-    if provider not in ["google", "discord"]:
+    if provider not in SUPPORTED_PROVIDERS:
         raise HTTPException(status_code=400, detail="Unsupported provider")
 
     state = secrets.token_urlsafe(32)
@@ -61,13 +168,13 @@ async def start_link_account(
 
         await OAuthStateStore.save_with_data(state, state_data)
 
-        redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/accounts/link/google/callback"
-        authorize_url = GoogleOAuth.get_authorize_url(redirect_uri, state, code_challenge)
+        authorize_url = GoogleOAuth.get_authorize_url(
+            GOOGLE_LINK_REDIRECT_URI, state, code_challenge
+        )
     else:
         await OAuthStateStore.save_with_data(state, state_data)
 
-        redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/accounts/link/discord/callback"
-        authorize_url = DiscordOAuth.get_authorize_url(redirect_uri, state)
+        authorize_url = DiscordOAuth.get_authorize_url(DISCORD_LINK_REDIRECT_URI, state)
 
     return RedirectResponse(url=authorize_url)
 
@@ -86,47 +193,32 @@ async def google_link_callback(
     user_id = state_data.get("user_id")
     code_verifier = state_data.get("code_verifier")
 
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/accounts/link/google/callback"
-    token_data = await GoogleOAuth.exchange_code(code, redirect_uri, code_verifier)
+    token_data = await GoogleOAuth.exchange_code(code, GOOGLE_LINK_REDIRECT_URI, code_verifier)
     if not token_data:
         raise HTTPException(status_code=400, detail="Failed to exchange code")
 
-    user_info = await GoogleOAuth.get_user_info(token_data["access_token"])
+    # Fetch user info while checking this user's own google links
+    user_info, own_ids = await asyncio.gather(
+        GoogleOAuth.get_user_info(token_data["access_token"]),
+        _own_provider_user_ids(db, user_id, "google"),
+    )
     if not user_info:
         raise HTTPException(status_code=400, detail="Failed to get user info")
 
-    # Check if this OAuth account is already linked to another user
-    existing = await db.execute(
-        select(OAuthAccount).where(
-            OAuthAccount.provider == "google",
-            OAuthAccount.provider_user_id == user_info["id"],
-        )
-    )
-    existing_account = existing.scalar_one_or_none()
+    if user_info["id"] in own_ids:
+        return RedirectResponse(url=ALREADY_LINKED_URL)
 
-    if existing_account:
-        if str(existing_account.user_id) == user_id:
-            return RedirectResponse(
-                url=f"{settings.FRONTEND_URL}/settings/accounts?status=already_linked"
-            )
+    linked_user_id = await _link_oauth_account(db, user_id, "google", user_info, token_data)
+    if linked_user_id is not None:
+        if str(linked_user_id) == user_id:
+            return RedirectResponse(url=ALREADY_LINKED_URL)
         raise HTTPException(
             status_code=400, detail="This account is already linked to another user"
         )
 
-    # Create new OAuth account link
-    oauth_account = OAuthAccount(
-        user_id=user_id,
-        provider="google",
-        provider_user_id=user_info["id"],
-        access_token=token_data["access_token"],
-        refresh_token=token_data.get("refresh_token"),
-    )
-    db.add(oauth_account)
-    await db.commit()
+    await LinkedAccountsCache.delete(user_id)
 
-    return RedirectResponse(
-        url=f"{settings.FRONTEND_URL}/settings/accounts?status=linked&provider=google"
-    )
+    return RedirectResponse(url=f"{ACCOUNTS_SETTINGS_URL}?status=linked&provider=google")
 
 
 @router.get("/link/discord/callback")
@@ -142,84 +234,56 @@ async def discord_link_callback(
 
     user_id = state_data.get("user_id")
 
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/accounts/link/discord/callback"
-    token_data = await DiscordOAuth.exchange_code(code, redirect_uri)
+    token_data = await DiscordOAuth.exchange_code(code, DISCORD_LINK_REDIRECT_URI)
     if not token_data:
         raise HTTPException(status_code=400, detail="Failed to exchange code")
 
-    user_info = await DiscordOAuth.get_user_info(token_data["access_token"])
+    # Fetch user info while checking this user's own discord links
+    user_info, own_ids = await asyncio.gather(
+        DiscordOAuth.get_user_info(token_data["access_token"]),
+        _own_provider_user_ids(db, user_id, "discord"),
+    )
     if not user_info:
         raise HTTPException(status_code=400, detail="Failed to get user info")
 
-    # Check if this OAuth account is already linked to another user
-    existing = await db.execute(
-        select(OAuthAccount).where(
-            OAuthAccount.provider == "discord",
-            OAuthAccount.provider_user_id == user_info["id"],
-        )
-    )
-    existing_account = existing.scalar_one_or_none()
+    if user_info["id"] in own_ids:
+        return RedirectResponse(url=ALREADY_LINKED_URL)
 
-    if existing_account:
-        if str(existing_account.user_id) == user_id:
-            return RedirectResponse(
-                url=f"{settings.FRONTEND_URL}/settings/accounts?status=already_linked"
-            )
+    linked_user_id = await _link_oauth_account(db, user_id, "discord", user_info, token_data)
+    if linked_user_id is not None:
+        if str(linked_user_id) == user_id:
+            return RedirectResponse(url=ALREADY_LINKED_URL)
         raise HTTPException(
             status_code=400, detail="This account is already linked to another user"
         )
 
-    # Create new OAuth account link
-    oauth_account = OAuthAccount(
-        user_id=user_id,
-        provider="discord",
-        provider_user_id=user_info["id"],
-        access_token=token_data["access_token"],
-        refresh_token=token_data.get("refresh_token"),
-    )
-    db.add(oauth_account)
-    await db.commit()
+    await LinkedAccountsCache.delete(user_id)
 
-    return RedirectResponse(
-        url=f"{settings.FRONTEND_URL}/settings/accounts?status=linked&provider=discord"
-    )
+    return RedirectResponse(url=f"{ACCOUNTS_SETTINGS_URL}?status=linked&provider=discord")
 
 
 @router.delete("/{provider}", response_model=UnlinkResponse)
 async def unlink_account(
     provider: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Unlink an OAuth provider from current user."""
-    if provider not in ["google", "discord"]:
+    if provider not in SUPPORTED_PROVIDERS:
         raise HTTPException(status_code=400, detail="Unsupported provider")
 
-    # Count linked accounts
-    count_result = await db.execute(
-        select(func.count())
-        .select_from(OAuthAccount)
-        .where(OAuthAccount.user_id == current_user.id)
-    )
-    account_count = count_result.scalar()
+    # Lock, count, guard and delete in one round trip
+    result = await db.execute(_UNLINK_ACCOUNT, {"user_id": current_user.id, "provider": provider})
+    account_count, deleted_provider = result.one()
 
     if account_count <= 1:
         raise HTTPException(status_code=400, detail="Cannot unlink the last authentication method")
 
-    # Find and delete the OAuth account
-    result = await db.execute(
-        select(OAuthAccount).where(
-            OAuthAccount.user_id == current_user.id,
-            OAuthAccount.provider == provider,
-        )
-    )
-    oauth_account = result.scalar_one_or_none()
-
-    if not oauth_account:
+    if deleted_provider is None:
         raise HTTPException(status_code=404, detail=f"No {provider} account linked")
 
-    await db.delete(oauth_account)
     await db.commit()
+    await LinkedAccountsCache.delete(current_user.id)
 
     return UnlinkResponse(
         message=f"Successfully unlinked {provider} account",
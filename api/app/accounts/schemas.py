@@ -3,12 +3,16 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+__all__ = ["OAuthAccountResponse", "UnlinkResponse"]
 
 
 class OAuthAccountResponse(BaseModel):
     """OAuth account response with provider info."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: uuid.UUID
     provider: str
     provider_user_id: str
@@ -17,9 +21,6 @@ class OAuthAccountResponse(BaseModel):
     provider_email: str | None = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class UnlinkResponse(BaseModel):
     """Unlink response."""
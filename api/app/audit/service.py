@@ -1,12 +1,39 @@
 """Audit logging service."""
 
+import asyncio
+import logging
 import os
 import uuid
 from enum import StrEnum
+from typing import Any
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = logging.getLogger(__name__)
+
+# Batch limits for the background writer
+AUDIT_BATCH_SIZE = 200
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.1
+# Past this backlog records are written inline rather than dropped
+AUDIT_QUEUE_MAXSIZE = 10_000
+
+# Queued by stop() to tell the writer to flush its batch and exit
+_STOP = object()
+
+_LOGIN_INSERT = text("""
+    INSERT INTO audit.login_history
+    (user_id, provider, ip_address, user_agent, success, failure_reason)
+    VALUES (:user_id, :provider, :ip_address, :user_agent, :success, :failure_reason)
+""")
+
+_EVENT_INSERT = text("""
+    INSERT INTO audit.auth_events
+    (user_id, event_type, details, ip_address, user_agent)
+    VALUES (:user_id, :event_type, CAST(:details AS jsonb), :ip_address, :user_agent)
+""")
+
 
 def _is_testing() -> bool:
     """Check if running in test environment."""
@@ -30,8 +57,170 @@ class AuthEventType(StrEnum):
     ALL_SESSIONS_REVOKED = "all_sessions_revoked"
 
 
+def _login_row(
+    user_id: uuid.UUID | None,
+    provider: str,
+    success: bool,
+    ip_address: str | None,
+    user_agent: str | None,
+    failure_reason: str | None,
+) -> dict[str, Any]:
+    return {
+        "user_id": str(user_id) if user_id else None,
+        "provider": provider,
+        "ip_address": ip_address,
+        "user_agent": user_agent[:500] if user_agent else None,
+        "success": success,
+        "failure_reason": failure_reason,
+    }
+
+
+def _event_row(
+    event_type: AuthEventType,
+    user_id: uuid.UUID | None,
+    details: dict | None,
+    ip_address: str | None,
+    user_agent: str | None,
+) -> dict[str, Any]:
+    return {
+        "user_id": str(user_id) if user_id else None,
+        "event_type": event_type.value,
+        "details": details,
+        "ip_address": ip_address,
+        "user_agent": user_agent[:500] if user_agent else None,
+    }
+
+
+def _serialize_events(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Encode JSONB details just before writing."""
+    return [
+        {**row, "details": orjson.dumps(row["details"]).decode() if row["details"] else None}
+        for row in rows
+    ]
+
+
 class AuditLogger:
-    """Audit logging service for authentication events."""
+    """Audit logging service for authentication events.
+
+    Once started, records are queued and written in batches by a
+    background task so login requests don't wait on an INSERT + commit.
+    Without a running writer, or when its queue is full, records are
+    written directly with the caller's session.
+    """
+
+    _queue: asyncio.Queue | None = None
+    _task: asyncio.Task | None = None
+    _db_session_factory = None
+
+    @classmethod
+    async def start(cls, db_session_factory) -> None:
+        """Start the background batch writer."""
+        if cls._task is not None:
+            logger.warning("AuditLogger writer is already running")
+            return
+
+        cls._db_session_factory = db_session_factory
+        cls._queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+        cls._task = asyncio.create_task(cls._drain())
+        logger.info("AuditLogger writer started")
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Stop the writer and flush anything still queued."""
+        if cls._task is None:
+            return
+
+        # The drainer writes the batch it is holding before it exits; cancelling
+        # it instead would drop records already taken off the queue
+        if not cls._task.done():
+            await cls._queue.put(_STOP)
+        await cls._task
+        cls._task = None
+
+        # Records logged while the writer was shutting down
+        remaining = []
+        while not cls._queue.empty():
+            remaining.append(cls._queue.get_nowait())
+        if remaining:
+            await cls._write_batch(remaining)
+
+        cls._queue = None
+        logger.info("AuditLogger writer stopped")
+
+    @classmethod
+    async def _drain(cls) -> None:
+        """Collect up to AUDIT_BATCH_SIZE records or one flush interval, then write."""
+        loop = asyncio.get_running_loop()
+        while True:
+            record = await cls._queue.get()
+            if record is _STOP:
+                return
+            batch = [record]
+            stopping = False
+            deadline = loop.time() + AUDIT_FLUSH_INTERVAL_SECONDS
+            while len(batch) < AUDIT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(cls._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if record is _STOP:
+                    stopping = True
+                    break
+                batch.append(record)
+            await cls._write_batch(batch)
+            if stopping:
+                return
+
+    @classmethod
+    async def _write_batch(cls, batch: list[tuple[str, dict[str, Any]]]) -> None:
+        """Write queued records with one executemany per audit table."""
+        logins = [row for kind, row in batch if kind == "login"]
+        events = [row for kind, row in batch if kind == "event"]
+        # Separate transactions: a failed event insert must not discard logins
+        if logins:
+            await cls._write_rows(_LOGIN_INSERT, logins)
+        if events:
+            await cls._write_rows(_EVENT_INSERT, _serialize_events(events))
+
+    @classmethod
+    async def _write_rows(cls, statement, rows: list[dict[str, Any]]) -> None:
+        """Insert rows into one audit table and commit.
+
+        If the batch fails, each row is retried in its own transaction so one
+        bad record doesn't cost the rest of the batch.
+        """
+        try:
+            await cls._insert(statement, rows)
+            return
+        except Exception as e:
+            logger.warning("Audit batch of %d records failed, writing singly: %s", len(rows), e)
+
+        for row in rows:
+            try:
+                await cls._insert(statement, [row])
+            except Exception as e:
+                logger.error("Failed to write audit record %s: %s", row, e)
+
+    @classmethod
+    async def _insert(cls, statement, rows: list[dict[str, Any]]) -> None:
+        """Run one executemany and commit it in a fresh session."""
+        async with cls._db_session_factory() as session:
+            await session.execute(statement, rows)
+            await session.commit()
+
+    @classmethod
+    def _enqueue(cls, kind: str, row: dict[str, Any]) -> bool:
+        """Hand a record to the writer; False if it isn't running or is backed up."""
+        if cls._queue is None:
+            return False
+        try:
+            cls._queue.put_nowait((kind, row))
+        except asyncio.QueueFull:
+            return False
+        return True
 
     @staticmethod
     async def log_login(
@@ -47,21 +236,11 @@ class AuditLogger:
         if _is_testing():
             return  # Skip audit logging in test environment
 
-        await db.execute(
-            text("""
-                INSERT INTO audit.login_history
-                (user_id, provider, ip_address, user_agent, success, failure_reason)
-                VALUES (:user_id, :provider, :ip_address, :user_agent, :success, :failure_reason)
-            """),
-            {
-                "user_id": str(user_id) if user_id else None,
-                "provider": provider,
-                "ip_address": ip_address,
-                "user_agent": user_agent[:500] if user_agent else None,
-                "success": success,
-                "failure_reason": failure_reason,
-            },
-        )
+        row = _login_row(user_id, provider, success, ip_address, user_agent, failure_reason)
+        if AuditLogger._enqueue("login", row):
+            return
+
+        await db.execute(_LOGIN_INSERT, row)
         await db.commit()
 
     @staticmethod
@@ -77,20 +256,9 @@ class AuditLogger:
         if _is_testing():
             return  # Skip audit logging in test environment
 
-        import json
-
-        await db.execute(
-            text("""
-                INSERT INTO audit.auth_events
-                (user_id, event_type, details, ip_address, user_agent)
-                VALUES (:user_id, :event_type, :details::jsonb, :ip_address, :user_agent)
-            """),
-            {
-                "user_id": str(user_id) if user_id else None,
-                "event_type": event_type.value,
-                "details": json.dumps(details) if details else None,
-                "ip_address": ip_address,
-                "user_agent": user_agent[:500] if user_agent else None,
-            },
-        )
+        row = _event_row(event_type, user_id, details, ip_address, user_agent)
+        if AuditLogger._enqueue("event", row):
+            return
+
+        await db.execute(_EVENT_INSERT, _serialize_events([row])[0])
         await db.commit()
@@ -1,5 +1,11 @@
-from .jwt import get_current_user
+from .jwt import CurrentUser, get_current_user
 from .router import router
 from .tokens import create_access_token, decode_access_token
 
-__all__ = ["router", "create_access_token", "decode_access_token", "get_current_user"]
+__all__ = [
+    "router",
+    "create_access_token",
+    "decode_access_token",
+    "get_current_user",
+    "CurrentUser",
+]
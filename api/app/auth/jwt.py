@@ -1,6 +1,8 @@
 """JWT token handling and user authentication."""
 
 import uuid
+from dataclasses import dataclass
+from datetime import datetime
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -11,6 +13,7 @@ from sqlalchemy.orm import selectinload
 from app.config import get_settings
 from app.db.session import get_db
 from app.models import User
+from app.valkey import UserCache
 
 from .tokens import decode_access_token
 
@@ -18,10 +21,86 @@ settings = get_settings()
 security = HTTPBearer()
 
 
+@dataclass(frozen=True, slots=True)
+class CurrentUserEmail:
+    """Email address of the authenticated user."""
+
+    id: uuid.UUID
+    email: str
+    is_primary: bool
+    verified_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    """Read-only snapshot of the authenticated user.
+
+    Not an ORM instance: load the User by id when relationships or writes are needed.
+    """
+
+    id: uuid.UUID
+    created_at: datetime | None
+    display_name: str | None
+    avatar_url: str | None
+    emails: tuple[CurrentUserEmail, ...]
+
+    @property
+    def email(self) -> str | None:
+        """Get primary email."""
+        for e in self.emails:
+            if e.is_primary:
+                return e.email
+        return self.emails[0].email if self.emails else None
+
+
+def _user_to_cache(user: User) -> dict:
+    """Snapshot a loaded user (with profile and emails) for UserCache."""
+    profile = user.profile
+    return {
+        "id": str(user.id),
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "profile": (
+            {"display_name": profile.display_name, "avatar_url": profile.avatar_url}
+            if profile
+            else None
+        ),
+        "emails": [
+            {
+                "id": str(e.id),
+                "email": e.email,
+                "is_primary": e.is_primary,
+                "verified_at": e.verified_at.isoformat() if e.verified_at else None,
+            }
+            for e in user.emails
+        ],
+    }
+
+
+def _user_from_cache(data: dict) -> CurrentUser:
+    """Rebuild the current user from a UserCache snapshot."""
+    created_at = data["created_at"]
+    profile = data["profile"] or {}
+    return CurrentUser(
+        id=uuid.UUID(data["id"]),
+        created_at=datetime.fromisoformat(created_at) if created_at else None,
+        display_name=profile.get("display_name"),
+        avatar_url=profile.get("avatar_url"),
+        emails=tuple(
+            CurrentUserEmail(
+                id=uuid.UUID(e["id"]),
+                email=e["email"],
+                is_primary=e["is_primary"],
+                verified_at=datetime.fromisoformat(e["verified_at"]) if e["verified_at"] else None,
+            )
+            for e in data["emails"]
+        ),
+    )
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
-) -> User:
+) -> CurrentUser:
     """Get the current authenticated user."""
     token = credentials.credentials
     payload = decode_access_token(token)
@@ -40,6 +119,10 @@ async def get_current_user(
             detail="Invalid token payload",
         )
 
+    cached = await UserCache.get(user_id)
+    if cached is not None:
+        return _user_from_cache(cached)
+
     result = await db.execute(
         select(User)
         .options(
@@ -56,4 +139,6 @@ async def get_current_user(
             detail="User not found",
         )
 
-    return user
+    snapshot = _user_to_cache(user)
+    await UserCache.set(user_id, snapshot)
+    return _user_from_cache(snapshot)
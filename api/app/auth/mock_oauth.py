@@ -4,17 +4,42 @@ Enable by setting MOCK_OAUTH_ENABLED=1 environment variable.
 This allows bypassing real OAuth providers during development.
 """
 
-import os
-import uuid
-from dataclasses import dataclass
+import secrets
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from functools import wraps
+from types import MappingProxyType
+from typing import Any
 
 
-def is_mock_oauth_enabled() -> bool:
-    """Check if mock OAuth is enabled."""
-    return os.getenv("MOCK_OAUTH_ENABLED", "").lower() in ("1", "true", "yes")
+def _freeze(value: Any) -> Any:
+    """Wrap dicts, nested ones included, in read-only views."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
 
 
-@dataclass
+def _memoized_format(
+    build: Callable[["MockOAuthUser"], Mapping[str, Any]],
+) -> Callable[["MockOAuthUser"], Mapping[str, Any]]:
+    """Build a provider format once per user and return a read-only view.
+
+    The view is shared by every caller, so nested dicts are frozen too.
+    """
+    key = build.__name__
+
+    @wraps(build)
+    def method(self: "MockOAuthUser") -> Mapping[str, Any]:
+        try:
+            return self._formats[key]
+        except KeyError:
+            view = self._formats[key] = _freeze(build(self))
+            return view
+
+    return method
+
+
+@dataclass(frozen=True, slots=True)
 class MockOAuthUser:
     """Mock OAuth user data."""
 
@@ -22,8 +47,13 @@ class MockOAuthUser:
     email: str
     name: str
     picture: str | None = None
+    # Memoized provider formats; the dict itself is mutable, so frozen still holds
+    _formats: dict[str, Mapping[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-    def to_google_format(self) -> dict:
+    @_memoized_format
+    def to_google_format(self) -> Mapping[str, Any]:
         """Convert to Google userinfo format."""
         return {
             "id": self.id,
@@ -33,7 +63,8 @@ class MockOAuthUser:
             "verified_email": True,
         }
 
-    def to_discord_format(self) -> dict:
+    @_memoized_format
+    def to_discord_format(self) -> Mapping[str, Any]:
         """Convert to Discord userinfo format."""
         return {
             "id": self.id,
@@ -43,7 +74,8 @@ class MockOAuthUser:
             "avatar_url": self.picture,
         }
 
-    def to_github_format(self) -> dict:
+    @_memoized_format
+    def to_github_format(self) -> Mapping[str, Any]:
         """Convert to GitHub userinfo format."""
         # Generate a numeric ID from the mock ID
         numeric_id = int(self.id.split("-")[-1]) if "-" in self.id else 12345
@@ -55,7 +87,8 @@ class MockOAuthUser:
             "avatar_url": self.picture,
         }
 
-    def to_x_format(self) -> dict:
+    @_memoized_format
+    def to_x_format(self) -> Mapping[str, Any]:
         """Convert to X (Twitter) userinfo format.
 
         Note: X API does not provide email addresses.
@@ -71,7 +104,8 @@ class MockOAuthUser:
             "email": f"{username}@x.yesod-auth.local",
         }
 
-    def to_linkedin_format(self) -> dict:
+    @_memoized_format
+    def to_linkedin_format(self) -> Mapping[str, Any]:
         """Convert to LinkedIn userinfo format (OpenID Connect)."""
         return {
             "sub": self.id,
@@ -81,7 +115,8 @@ class MockOAuthUser:
             "email_verified": True,
         }
 
-    def to_facebook_format(self) -> dict:
+    @_memoized_format
+    def to_facebook_format(self) -> Mapping[str, Any]:
         """Convert to Facebook Graph API userinfo format."""
         return {
             "id": self.id,
@@ -95,7 +130,8 @@ class MockOAuthUser:
             },
         }
 
-    def to_slack_format(self) -> dict:
+    @_memoized_format
+    def to_slack_format(self) -> Mapping[str, Any]:
         """Convert to Slack OpenID Connect userinfo format."""
         return {
             "ok": True,
@@ -106,7 +142,8 @@ class MockOAuthUser:
             "email_verified": True,
         }
 
-    def to_twitch_format(self) -> dict:
+    @_memoized_format
+    def to_twitch_format(self) -> Mapping[str, Any]:
         """Convert to Twitch Helix API userinfo format."""
         login = self.name.lower().replace(" ", "_")
         return {
@@ -144,9 +181,13 @@ MOCK_USERS = {
 }
 
 
+# Fallback for unknown mock usernames
+_DEFAULT_MOCK_USER = MOCK_USERS["alice"]
+
+
 def get_mock_user(username: str = "alice") -> MockOAuthUser:
     """Get a mock user by username."""
-    return MOCK_USERS.get(username, MOCK_USERS["alice"])
+    return MOCK_USERS.get(username, _DEFAULT_MOCK_USER)
 
 
 def create_custom_mock_user(
@@ -156,7 +197,7 @@ def create_custom_mock_user(
 ) -> MockOAuthUser:
     """Create a custom mock user."""
     return MockOAuthUser(
-        id=f"mock-{uuid.uuid4().hex[:8]}",
+        id=f"mock-{secrets.token_hex(4)}",
         email=email,
         name=name or email.split("@")[0],
         picture=picture or f"https://api.dicebear.com/7.x/avataaars/svg?seed={email}",
@@ -1,18 +1,128 @@
 """OAuth provider implementations."""
 
+import asyncio
+import base64
+from functools import lru_cache
+from urllib.parse import quote, urlencode
+
 import httpx
+import orjson
 
 from app.config import get_settings
 
 settings = get_settings()
 
+# One pooled client per provider so a slow provider can't exhaust the
+# connections other providers' logins need
+_http_clients: dict[str, httpx.AsyncClient] = {}
 
-class GoogleOAuth:
-    """Google OAuth implementation with PKCE support."""
 
-    AUTHORIZE_URL = "https://accounts.google.com/o/oauth2/v2/auth"
-    TOKEN_URL = "https://oauth2.googleapis.com/token"
-    USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
+def get_http_client(provider: str) -> httpx.AsyncClient:
+    """Get the pooled HTTP client for a provider's requests."""
+    client = _http_clients.get(provider)
+    if client is None:
+        # HTTP/2 multiplexes concurrent calls to one provider host over one connection
+        client = _http_clients[provider] = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=10, max_connections=50, keepalive_expiry=30.0
+            ),
+        )
+    return client
+
+
+# Static request headers
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+_JSON_ACCEPT_HEADERS = {"Accept": "application/json"}
+_GITHUB_ACCEPT = {"Accept": "application/vnd.github+json"}
+
+
+def _bearer(access_token: str, extra: dict | None = None) -> dict:
+    """Build request headers carrying a bearer token."""
+    headers = {"Authorization": f"Bearer {access_token}"}
+    if extra:
+        headers.update(extra)
+    return headers
+
+
+def _encode_query(params: dict) -> str:
+    """URL-encode query parameters."""
+    return urlencode(params, quote_via=quote)
+
+
+def _q(value: str) -> str:
+    """Percent-encode a single query value (same as _encode_query)."""
+    return quote(value, safe="")
+
+
+def _build_auth_url(
+    prefix: str,
+    client_id: str,
+    redirect_uri: str,
+    state: str,
+    code_challenge: str | None = None,
+    nonce: str | None = None,
+) -> str:
+    """Build an authorization URL by appending per-request values to a pre-encoded prefix.
+
+    PKCE parameters are added when a challenge is given.
+    """
+    url = f"{prefix}&client_id={_q(client_id)}&redirect_uri={_q(redirect_uri)}&state={_q(state)}"
+    if nonce:
+        url = f"{url}&nonce={_q(nonce)}"
+    if code_challenge:
+        url = f"{url}&code_challenge={_q(code_challenge)}&code_challenge_method=S256"
+    return url
+
+
+@lru_cache(maxsize=8)
+def _basic_auth_header(client_id: str, client_secret: str) -> str:
+    """Encode client credentials as an HTTP Basic Authorization header (once per pair)."""
+    credentials = f"{client_id}:{client_secret}"
+    return f"Basic {base64.b64encode(credentials.encode()).decode()}"
+
+
+async def close_http_client() -> None:
+    """Close all provider HTTP clients."""
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+class OAuthProvider:
+    """Shared OAuth 2.0 authorization code flow.
+
+    Providers differ mostly in data (endpoints, scopes, credentials), so subclasses
+    declare that data and override the small hooks below only for their quirks.
+    """
+
+    AUTHORIZE_URL: str
+    TOKEN_URL: str
+    USERINFO_URL: str
+    AUTHORIZE_QUERY: str
+    # Names of the settings holding the client credentials
+    CLIENT_ID_SETTING: str
+    CLIENT_SECRET_SETTING: str
+    # Headers sent with the token request
+    TOKEN_HEADERS: dict | None = _FORM_HEADERS
+    # Whether the token request carries grant_type=authorization_code
+    TOKEN_GRANT_TYPE = True
+    # AUTHORIZE_URL plus the static query, joined once per provider class
+    _AUTHORIZE_PREFIX: str
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._AUTHORIZE_PREFIX = f"{cls.AUTHORIZE_URL}?{cls.AUTHORIZE_QUERY}"
+
+    @classmethod
+    def _credentials(cls) -> tuple[str, str]:
+        """Return (client_id, client_secret); read per call so settings can be swapped."""
+        return (
+            getattr(settings, cls.CLIENT_ID_SETTING),
+            getattr(settings, cls.CLIENT_SECRET_SETTING),
+        )
 
     @classmethod
     def get_authorize_url(
@@ -21,88 +131,55 @@ class GoogleOAuth:
         state: str,
         code_challenge: str | None = None,
     ) -> str:
-        """Get the Google OAuth authorization URL with optional PKCE."""
-        params = {
-            "client_id": settings.GOOGLE_CLIENT_ID,
-            "redirect_uri": redirect_uri,
-            "response_type": "code",
-            "scope": "openid email profile",
-            "state": state,
-            "access_type": "offline",
-            "prompt": "consent",
-        }
-        if code_challenge:
-            params["code_challenge"] = code_challenge
-            params["code_challenge_method"] = "S256"
-
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{cls.AUTHORIZE_URL}?{query}"
+        """Get the OAuth authorization URL with optional PKCE."""
+        return cls._authorize_url(redirect_uri, state, code_challenge)
 
     @classmethod
-    async def exchange_code(
+    def _authorize_url(
         cls,
-        code: str,
         redirect_uri: str,
-        code_verifier: str | None = None,
-    ) -> dict | None:
-        """Exchange authorization code for tokens."""
+        state: str,
+        code_challenge: str | None = None,
+        nonce: str | None = None,
+    ) -> str:
+        return _build_auth_url(
+            cls._AUTHORIZE_PREFIX,
+            cls._credentials()[0],
+            redirect_uri,
+            state,
+            code_challenge,
+            nonce,
+        )
+
+    @classmethod
+    def _token_params(cls, code: str, redirect_uri: str, code_verifier: str | None) -> dict:
+        client_id, client_secret = cls._credentials()
         data = {
-            "client_id": settings.GOOGLE_CLIENT_ID,
-            "client_secret": settings.GOOGLE_CLIENT_SECRET,
+            "client_id": client_id,
+            "client_secret": client_secret,
             "code": code,
-            "grant_type": "authorization_code",
             "redirect_uri": redirect_uri,
         }
+        if cls.TOKEN_GRANT_TYPE:
+            data["grant_type"] = "authorization_code"
         if code_verifier:
             data["code_verifier"] = code_verifier
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(cls.TOKEN_URL, data=data)
-            if response.status_code == 200:
-                return response.json()
-            return None
+        return data
 
     @classmethod
-    async def get_user_info(cls, access_token: str) -> dict | None:
-        """Get user info from Google."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                cls.USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            if response.status_code == 200:
-                return response.json()
-            return None
-
-
-class GitHubOAuth:
-    """GitHub OAuth implementation with PKCE support."""
-
-    AUTHORIZE_URL = "https://github.com/login/oauth/authorize"
-    TOKEN_URL = "https://github.com/login/oauth/access_token"
-    USERINFO_URL = "https://api.github.com/user"
-    EMAILS_URL = "https://api.github.com/user/emails"
+    def _token_headers(cls) -> dict | None:
+        return cls.TOKEN_HEADERS
 
     @classmethod
-    def get_authorize_url(
-        cls,
-        redirect_uri: str,
-        state: str,
-        code_challenge: str | None = None,
-    ) -> str:
-        """Get the GitHub OAuth authorization URL with optional PKCE."""
-        params = {
-            "client_id": settings.GITHUB_CLIENT_ID,
-            "redirect_uri": redirect_uri,
-            "scope": "read:user user:email",
-            "state": state,
-        }
-        if code_challenge:
-            params["code_challenge"] = code_challenge
-            params["code_challenge_method"] = "S256"
-
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{cls.AUTHORIZE_URL}?{query}"
+    def _parse(cls, response: httpx.Response) -> dict | None:
+        """Decode a successful provider response, or None on failure."""
+        # An empty or non-JSON 2xx body is as unusable as an error status
+        if not response.is_success or not response.content:
+            return None
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return None
 
     @classmethod
     async def exchange_code(
@@ -111,79 +188,118 @@ class GitHubOAuth:
         redirect_uri: str,
         code_verifier: str | None = None,
     ) -> dict | None:
-        """Exchange authorization code for tokens."""
-        data = {
-            "client_id": settings.GITHUB_CLIENT_ID,
-            "client_secret": settings.GITHUB_CLIENT_SECRET,
-            "code": code,
-            "redirect_uri": redirect_uri,
-        }
-        if code_verifier:
-            data["code_verifier"] = code_verifier
+        """Exchange authorization code for tokens with optional PKCE verifier."""
+        client = get_http_client(cls.__name__)
+        response = await client.post(
+            cls.TOKEN_URL,
+            data=cls._token_params(code, redirect_uri, code_verifier),
+            headers=cls._token_headers(),
+        )
+        return cls._parse(response)
+
+    @classmethod
+    def _userinfo_request(cls, access_token: str) -> dict:
+        """Keyword arguments for the userinfo GET request."""
+        return {"headers": _bearer(access_token)}
+
+    @classmethod
+    def _userinfo(cls, data: dict) -> dict | None:
+        """Normalize the decoded userinfo payload."""
+        return data
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                cls.TOKEN_URL,
-                data=data,
-                headers={"Accept": "application/json"},
-            )
-            if response.status_code == 200:
-                return response.json()
+    @classmethod
+    async def get_user_info(cls, access_token: str) -> dict | None:
+        """Get user info from the provider."""
+        client = get_http_client(cls.__name__)
+        response = await client.get(cls.USERINFO_URL, **cls._userinfo_request(access_token))
+        data = cls._parse(response)
+        if data is None:
             return None
+        return cls._userinfo(data)
+
+
+class GoogleOAuth(OAuthProvider):
+    """Google OAuth implementation with PKCE support."""
+
+    AUTHORIZE_URL = "https://accounts.google.com/o/oauth2/v2/auth"
+    TOKEN_URL = "https://oauth2.googleapis.com/token"
+    USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
+    AUTHORIZE_QUERY = _encode_query(
+        {
+            "response_type": "code",
+            "scope": "openid email profile",
+            "access_type": "offline",
+            "prompt": "consent",
+        }
+    )
+    CLIENT_ID_SETTING = "GOOGLE_CLIENT_ID"
+    CLIENT_SECRET_SETTING = "GOOGLE_CLIENT_SECRET"
+    TOKEN_HEADERS = None
+
+
+class GitHubOAuth(OAuthProvider):
+    """GitHub OAuth implementation with PKCE support."""
+
+    AUTHORIZE_URL = "https://github.com/login/oauth/authorize"
+    TOKEN_URL = "https://github.com/login/oauth/access_token"
+    USERINFO_URL = "https://api.github.com/user"
+    EMAILS_URL = "https://api.github.com/user/emails"
+    AUTHORIZE_QUERY = _encode_query({"scope": "read:user user:email"})
+    CLIENT_ID_SETTING = "GITHUB_CLIENT_ID"
+    CLIENT_SECRET_SETTING = "GITHUB_CLIENT_SECRET"
+    TOKEN_HEADERS = _JSON_ACCEPT_HEADERS
+    TOKEN_GRANT_TYPE = False
 
     @classmethod
     async def get_user_info(cls, access_token: str) -> dict | None:
         """Get user info from GitHub."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
+        # Fetch the emails API alongside the profile instead of after it; it is
+        # only used when the email is private, but this saves a round trip
+        response, email = await asyncio.gather(
+            get_http_client(cls.__name__).get(
                 cls.USERINFO_URL,
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Accept": "application/vnd.github+json",
-                },
-            )
-            if response.status_code != 200:
-                return None
-
-            user_data = response.json()
+                headers=_bearer(access_token, _GITHUB_ACCEPT),
+            ),
+            cls._get_primary_email(access_token),
+            return_exceptions=True,
+        )
+        if isinstance(response, BaseException):
+            raise response
+        user_data = cls._parse(response)
+        if user_data is None:
+            return None
 
-            # If email is not public, fetch from emails API
-            if not user_data.get("email"):
-                email = await cls._get_primary_email(access_token)
-                if email:
-                    user_data["email"] = email
+        # If email is not public, use the one from the emails API
+        if not user_data.get("email") and isinstance(email, str):
+            user_data["email"] = email
 
-            return user_data
+        return user_data
 
     @classmethod
     async def _get_primary_email(cls, access_token: str) -> str | None:
         """Get primary email from GitHub emails API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                cls.EMAILS_URL,
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Accept": "application/vnd.github+json",
-                },
-            )
-            if response.status_code != 200:
-                return None
-
-            emails = response.json()
-            # Find primary verified email
-            for email_data in emails:
-                if email_data.get("primary") and email_data.get("verified"):
-                    return email_data.get("email")
+        client = get_http_client(cls.__name__)
+        response = await client.get(
+            cls.EMAILS_URL,
+            headers=_bearer(access_token, _GITHUB_ACCEPT),
+        )
+        emails = cls._parse(response)
+        if emails is None:
+            return None
 
-            # Fallback to first verified email
-            for email_data in emails:
-                if email_data.get("verified"):
+        # Prefer the primary verified email, falling back to the first verified one
+        fallback = None
+        for email_data in emails:
+            if email_data.get("verified"):
+                if email_data.get("primary"):
                     return email_data.get("email")
+                if fallback is None:
+                    fallback = email_data.get("email")
 
-            return None
+        return fallback
 
 
-class DiscordOAuth:
+class DiscordOAuth(OAuthProvider):
     """Discord OAuth implementation with PKCE support.
 
     Note: Discord supports PKCE but doesn't officially document it.
@@ -193,80 +309,37 @@ class DiscordOAuth:
     AUTHORIZE_URL = "https://discord.com/api/oauth2/authorize"
     TOKEN_URL = "https://discord.com/api/oauth2/token"
     USERINFO_URL = "https://discord.com/api/users/@me"
-
-    @classmethod
-    def get_authorize_url(
-        cls,
-        redirect_uri: str,
-        state: str,
-        code_challenge: str | None = None,
-    ) -> str:
-        """Get the Discord OAuth authorization URL with optional PKCE."""
-        params = {
-            "client_id": settings.DISCORD_CLIENT_ID,
-            "redirect_uri": redirect_uri,
+    AUTHORIZE_QUERY = _encode_query(
+        {
             "response_type": "code",
             "scope": "identify email",
-            "state": state,
-        }
-        if code_challenge:
-            params["code_challenge"] = code_challenge
-            params["code_challenge_method"] = "S256"
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{cls.AUTHORIZE_URL}?{query}"
-
-    @classmethod
-    async def exchange_code(
-        cls,
-        code: str,
-        redirect_uri: str,
-        code_verifier: str | None = None,
-    ) -> dict | None:
-        """Exchange authorization code for tokens with optional PKCE verifier."""
-        data = {
-            "client_id": settings.DISCORD_CLIENT_ID,
-            "client_secret": settings.DISCORD_CLIENT_SECRET,
-            "code": code,
-            "grant_type": "authorization_code",
-            "redirect_uri": redirect_uri,
         }
-        if code_verifier:
-            data["code_verifier"] = code_verifier
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                cls.TOKEN_URL,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            if response.status_code == 200:
-                return response.json()
-            return None
+    )
+    CLIENT_ID_SETTING = "DISCORD_CLIENT_ID"
+    CLIENT_SECRET_SETTING = "DISCORD_CLIENT_SECRET"
 
     @classmethod
-    async def get_user_info(cls, access_token: str) -> dict | None:
-        """Get user info from Discord."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                cls.USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            if response.status_code == 200:
-                data = response.json()
-                # Add avatar URL
-                if data.get("avatar"):
-                    data["avatar_url"] = (
-                        f"https://cdn.discordapp.com/avatars/{data['id']}/{data['avatar']}.png"
-                    )
-                return data
-            return None
+    def _userinfo(cls, data: dict) -> dict | None:
+        # Add avatar URL
+        if (avatar := data.get("avatar")) and (user_id := data.get("id")):
+            data["avatar_url"] = f"https://cdn.discordapp.com/avatars/{user_id}/{avatar}.png"
+        return data
 
 
-class XOAuth:
+class XOAuth(OAuthProvider):
     """X (Twitter) OAuth 2.0 implementation with PKCE (required)."""
 
     AUTHORIZE_URL = "https://twitter.com/i/oauth2/authorize"
     TOKEN_URL = "https://api.twitter.com/2/oauth2/token"
     USERINFO_URL = "https://api.twitter.com/2/users/me"
+    AUTHORIZE_QUERY = _encode_query(
+        {
+            "response_type": "code",
+            "scope": "tweet.read users.read offline.access",
+        }
+    )
+    CLIENT_ID_SETTING = "X_CLIENT_ID"
+    CLIENT_SECRET_SETTING = "X_CLIENT_SECRET"
 
     @classmethod
     def get_authorize_url(
@@ -276,17 +349,7 @@ class XOAuth:
         code_challenge: str,
     ) -> str:
         """Get the X OAuth authorization URL with PKCE (required for X)."""
-        params = {
-            "client_id": settings.X_CLIENT_ID,
-            "redirect_uri": redirect_uri,
-            "response_type": "code",
-            "scope": "tweet.read users.read offline.access",
-            "state": state,
-            "code_challenge": code_challenge,
-            "code_challenge_method": "S256",
-        }
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{cls.AUTHORIZE_URL}?{query}"
+        return cls._authorize_url(redirect_uri, state, code_challenge)
 
     @classmethod
     async def exchange_code(
@@ -296,142 +359,67 @@ class XOAuth:
         code_verifier: str,
     ) -> dict | None:
         """Exchange authorization code for tokens using Basic auth."""
-        import base64
+        return await super().exchange_code(code, redirect_uri, code_verifier)
 
+    @classmethod
+    def _token_params(cls, code: str, redirect_uri: str, code_verifier: str | None) -> dict:
+        # Client credentials go in the Authorization header, not the body
+        return {
+            "code": code,
+            "grant_type": "authorization_code",
+            "redirect_uri": redirect_uri,
+            "code_verifier": code_verifier,
+        }
+
+    @classmethod
+    def _token_headers(cls) -> dict | None:
         # X requires Basic auth with client_id:client_secret
-        credentials = f"{settings.X_CLIENT_ID}:{settings.X_CLIENT_SECRET}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                cls.TOKEN_URL,
-                data={
-                    "code": code,
-                    "grant_type": "authorization_code",
-                    "redirect_uri": redirect_uri,
-                    "code_verifier": code_verifier,
-                },
-                headers={
-                    "Authorization": f"Basic {encoded}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-            )
-            if response.status_code == 200:
-                return response.json()
-            return None
+        return {"Authorization": _basic_auth_header(*cls._credentials()), **_FORM_HEADERS}
 
     @classmethod
-    async def get_user_info(cls, access_token: str) -> dict | None:
-        """Get user info from X."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                cls.USERINFO_URL,
-                params={"user.fields": "id,username,name,profile_image_url"},
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            if response.status_code == 200:
-                data = response.json()
-                # X API wraps user data in "data" field
-                return data.get("data")
-            return None
+    def _userinfo_request(cls, access_token: str) -> dict:
+        return {
+            "params": {"user.fields": "id,username,name,profile_image_url"},
+            "headers": _bearer(access_token),
+        }
+
+    @classmethod
+    def _userinfo(cls, data: dict) -> dict | None:
+        # X API wraps user data in "data" field
+        return data.get("data")
 
 
-class LinkedInOAuth:
+class LinkedInOAuth(OAuthProvider):
     """LinkedIn OAuth 2.0 implementation with OpenID Connect."""
 
     AUTHORIZE_URL = "https://www.linkedin.com/oauth/v2/authorization"
     TOKEN_URL = "https://www.linkedin.com/oauth/v2/accessToken"
     USERINFO_URL = "https://api.linkedin.com/v2/userinfo"
-
-    @classmethod
-    def get_authorize_url(
-        cls,
-        redirect_uri: str,
-        state: str,
-        code_challenge: str | None = None,
-    ) -> str:
-        """Get the LinkedIn OAuth authorization URL with optional PKCE."""
-        params = {
-            "client_id": settings.LINKEDIN_CLIENT_ID,
-            "redirect_uri": redirect_uri,
+    AUTHORIZE_QUERY = _encode_query(
+        {
             "response_type": "code",
             "scope": "openid profile email",
-            "state": state,
-        }
-        if code_challenge:
-            params["code_challenge"] = code_challenge
-            params["code_challenge_method"] = "S256"
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{cls.AUTHORIZE_URL}?{query}"
-
-    @classmethod
-    async def exchange_code(
-        cls,
-        code: str,
-        redirect_uri: str,
-        code_verifier: str | None = None,
-    ) -> dict | None:
-        """Exchange authorization code for tokens."""
-        data = {
-            "grant_type": "authorization_code",
-            "code": code,
-            "redirect_uri": redirect_uri,
-            "client_id": settings.LINKEDIN_CLIENT_ID,
-            "client_secret": settings.LINKEDIN_CLIENT_SECRET,
         }
-        if code_verifier:
-            data["code_verifier"] = code_verifier
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                cls.TOKEN_URL,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            if response.status_code == 200:
-                return response.json()
-            return None
-
-    @classmethod
-    async def get_user_info(cls, access_token: str) -> dict | None:
-        """Get user info from LinkedIn using OpenID Connect userinfo endpoint."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                cls.USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            if response.status_code == 200:
-                return response.json()
-            return None
+    )
+    CLIENT_ID_SETTING = "LINKEDIN_CLIENT_ID"
+    CLIENT_SECRET_SETTING = "LINKEDIN_CLIENT_SECRET"
 
 
-class FacebookOAuth:
+class FacebookOAuth(OAuthProvider):
     """Facebook OAuth 2.0 implementation."""
 
     AUTHORIZE_URL = "https://www.facebook.com/v18.0/dialog/oauth"
     TOKEN_URL = "https://graph.facebook.com/v18.0/oauth/access_token"
     USERINFO_URL = "https://graph.facebook.com/v18.0/me"
-
-    @classmethod
-    def get_authorize_url(
-        cls,
-        redirect_uri: str,
-        state: str,
-        code_challenge: str | None = None,
-    ) -> str:
-        """Get the Facebook OAuth authorization URL with optional PKCE."""
-        params = {
-            "client_id": settings.FACEBOOK_CLIENT_ID,
-            "redirect_uri": redirect_uri,
+    AUTHORIZE_QUERY = _encode_query(
+        {
             "response_type": "code",
             "scope": "email public_profile",
-            "state": state,
         }
-        if code_challenge:
-            params["code_challenge"] = code_challenge
-            params["code_challenge_method"] = "S256"
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{cls.AUTHORIZE_URL}?{query}"
+    )
+    CLIENT_ID_SETTING = "FACEBOOK_CLIENT_ID"
+    CLIENT_SECRET_SETTING = "FACEBOOK_CLIENT_SECRET"
+    TOKEN_GRANT_TYPE = False
 
     @classmethod
     async def exchange_code(
@@ -440,43 +428,32 @@ class FacebookOAuth:
         redirect_uri: str,
         code_verifier: str | None = None,
     ) -> dict | None:
-        """Exchange authorization code for tokens."""
-        params = {
-            "client_id": settings.FACEBOOK_CLIENT_ID,
-            "client_secret": settings.FACEBOOK_CLIENT_SECRET,
-            "code": code,
-            "redirect_uri": redirect_uri,
-        }
-        if code_verifier:
-            params["code_verifier"] = code_verifier
+        """Exchange authorization code for tokens (Graph API uses GET)."""
+        client = get_http_client(cls.__name__)
+        response = await client.get(
+            cls.TOKEN_URL,
+            params=cls._token_params(code, redirect_uri, code_verifier),
+        )
+        return cls._parse(response)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(cls.TOKEN_URL, params=params)
-            if response.status_code == 200:
-                return response.json()
-            return None
+    @classmethod
+    def _userinfo_request(cls, access_token: str) -> dict:
+        return {
+            "params": {
+                "fields": "id,name,email,picture.type(large)",
+                "access_token": access_token,
+            }
+        }
 
     @classmethod
-    async def get_user_info(cls, access_token: str) -> dict | None:
-        """Get user info from Facebook."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                cls.USERINFO_URL,
-                params={
-                    "fields": "id,name,email,picture.type(large)",
-                    "access_token": access_token,
-                },
-            )
-            if response.status_code == 200:
-                data = response.json()
-                # Extract picture URL from nested structure
-                if data.get("picture", {}).get("data", {}).get("url"):
-                    data["picture_url"] = data["picture"]["data"]["url"]
-                return data
-            return None
+    def _userinfo(cls, data: dict) -> dict | None:
+        # Extract picture URL from nested structure
+        if data.get("picture", {}).get("data", {}).get("url"):
+            data["picture_url"] = data["picture"]["data"]["url"]
+        return data
 
 
-class SlackOAuth:
+class SlackOAuth(OAuthProvider):
     """Slack OAuth 2.0 implementation with OpenID Connect and PKCE support.
 
     Note: Slack does not officially document PKCE support.
@@ -486,6 +463,14 @@ class SlackOAuth:
     AUTHORIZE_URL = "https://slack.com/openid/connect/authorize"
     TOKEN_URL = "https://slack.com/api/openid.connect.token"
     USERINFO_URL = "https://slack.com/api/openid.connect.userInfo"
+    AUTHORIZE_QUERY = _encode_query(
+        {
+            "response_type": "code",
+            "scope": "openid email profile",
+        }
+    )
+    CLIENT_ID_SETTING = "SLACK_CLIENT_ID"
+    CLIENT_SECRET_SETTING = "SLACK_CLIENT_SECRET"
 
     @classmethod
     def get_authorize_url(
@@ -496,66 +481,18 @@ class SlackOAuth:
         nonce: str | None = None,
     ) -> str:
         """Get the Slack OAuth authorization URL with optional PKCE."""
-        params = {
-            "client_id": settings.SLACK_CLIENT_ID,
-            "redirect_uri": redirect_uri,
-            "response_type": "code",
-            "scope": "openid email profile",
-            "state": state,
-        }
-        if code_challenge:
-            params["code_challenge"] = code_challenge
-            params["code_challenge_method"] = "S256"
-        if nonce:
-            params["nonce"] = nonce
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{cls.AUTHORIZE_URL}?{query}"
+        return cls._authorize_url(redirect_uri, state, code_challenge, nonce)
 
     @classmethod
-    async def exchange_code(
-        cls,
-        code: str,
-        redirect_uri: str,
-        code_verifier: str | None = None,
-    ) -> dict | None:
-        """Exchange authorization code for tokens with optional PKCE verifier."""
-        data = {
-            "client_id": settings.SLACK_CLIENT_ID,
-            "client_secret": settings.SLACK_CLIENT_SECRET,
-            "code": code,
-            "redirect_uri": redirect_uri,
-            "grant_type": "authorization_code",
-        }
-        if code_verifier:
-            data["code_verifier"] = code_verifier
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                cls.TOKEN_URL,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            if response.status_code == 200:
-                resp_data = response.json()
-                if resp_data.get("ok"):
-                    return resp_data
-            return None
-
-    @classmethod
-    async def get_user_info(cls, access_token: str) -> dict | None:
-        """Get user info from Slack using OpenID Connect userinfo endpoint."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                cls.USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("ok"):
-                    return data
-            return None
+    def _parse(cls, response: httpx.Response) -> dict | None:
+        # Slack reports errors in the body with HTTP 200
+        data = super()._parse(response)
+        if data is not None and data.get("ok"):
+            return data
+        return None
 
 
-class TwitchOAuth:
+class TwitchOAuth(OAuthProvider):
     """Twitch OAuth 2.0 implementation with OpenID Connect and PKCE support.
 
     Note: Twitch does not officially document PKCE support.
@@ -565,6 +502,14 @@ class TwitchOAuth:
     AUTHORIZE_URL = "https://id.twitch.tv/oauth2/authorize"
     TOKEN_URL = "https://id.twitch.tv/oauth2/token"
     USERINFO_URL = "https://api.twitch.tv/helix/users"
+    AUTHORIZE_QUERY = _encode_query(
+        {
+            "response_type": "code",
+            "scope": "openid user:read:email",
+        }
+    )
+    CLIENT_ID_SETTING = "TWITCH_CLIENT_ID"
+    CLIENT_SECRET_SETTING = "TWITCH_CLIENT_SECRET"
 
     @classmethod
     def get_authorize_url(
@@ -575,63 +520,16 @@ class TwitchOAuth:
         nonce: str | None = None,
     ) -> str:
         """Get the Twitch OAuth authorization URL with optional PKCE."""
-        params = {
-            "client_id": settings.TWITCH_CLIENT_ID,
-            "redirect_uri": redirect_uri,
-            "response_type": "code",
-            "scope": "openid user:read:email",
-            "state": state,
-        }
-        if code_challenge:
-            params["code_challenge"] = code_challenge
-            params["code_challenge_method"] = "S256"
-        if nonce:
-            params["nonce"] = nonce
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{cls.AUTHORIZE_URL}?{query}"
+        return cls._authorize_url(redirect_uri, state, code_challenge, nonce)
 
     @classmethod
-    async def exchange_code(
-        cls,
-        code: str,
-        redirect_uri: str,
-        code_verifier: str | None = None,
-    ) -> dict | None:
-        """Exchange authorization code for tokens with optional PKCE verifier."""
-        data = {
-            "client_id": settings.TWITCH_CLIENT_ID,
-            "client_secret": settings.TWITCH_CLIENT_SECRET,
-            "code": code,
-            "redirect_uri": redirect_uri,
-            "grant_type": "authorization_code",
-        }
-        if code_verifier:
-            data["code_verifier"] = code_verifier
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                cls.TOKEN_URL,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            if response.status_code == 200:
-                return response.json()
-            return None
+    def _userinfo_request(cls, access_token: str) -> dict:
+        return {"headers": _bearer(access_token, {"Client-Id": settings.TWITCH_CLIENT_ID})}
 
     @classmethod
-    async def get_user_info(cls, access_token: str) -> dict | None:
-        """Get user info from Twitch Helix API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                cls.USERINFO_URL,
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Client-Id": settings.TWITCH_CLIENT_ID,
-                },
-            )
-            if response.status_code == 200:
-                data = response.json()
-                # Twitch API wraps user data in "data" array
-                users = data.get("data", [])
-                if users:
-                    return users[0]
-            return None
+    def _userinfo(cls, data: dict) -> dict | None:
+        # Twitch API wraps user data in "data" array
+        users = data.get("data", [])
+        if users:
+            return users[0]
+        return None
@@ -5,6 +5,10 @@ import hashlib
 import secrets
 
 
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
 def generate_code_verifier() -> str:
     """Generate a cryptographically random code verifier."""
     return secrets.token_urlsafe(64)
@@ -12,11 +16,25 @@ def generate_code_verifier() -> str:
 
 def generate_code_challenge(code_verifier: str) -> str:
     """Generate code challenge from code verifier using S256 method."""
-    digest = hashlib.sha256(code_verifier.encode()).digest()
-    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+    return _b64url(hashlib.sha256(code_verifier.encode()).digest())
+
+
+def generate_state_and_pkce() -> tuple[str, str, str]:
+    """Generate (state, code_verifier, code_challenge) from a single random draw.
+
+    Same sizes as token_urlsafe(32) for the state and generate_code_verifier().
+    """
+    raw = secrets.token_bytes(96)
+    code_verifier = _b64url(raw[32:])
+    return _b64url(raw[:32]), code_verifier, generate_code_challenge(code_verifier)
 
 
 def verify_code_challenge(code_verifier: str, code_challenge: str) -> bool:
     """Verify that code_verifier matches code_challenge."""
-    expected = generate_code_challenge(code_verifier)
-    return secrets.compare_digest(expected, code_challenge)
+    # Compare raw digests: decode the challenge once instead of re-encoding the hash
+    try:
+        challenge = base64.urlsafe_b64decode(code_challenge + "=" * (-len(code_challenge) % 4))
+    except ValueError:
+        return False
+    expected = hashlib.sha256(code_verifier.encode()).digest()
+    return secrets.compare_digest(expected, challenge)
@@ -7,14 +7,21 @@ from app.config import get_settings
 
 settings = get_settings()
 
+# Formatted once; the setting is fixed for the life of the process
+_RATE_LIMIT = f"{settings.RATE_LIMIT_PER_MINUTE}/minute"
+
 # Create limiter instance
 limiter = Limiter(
     key_func=get_remote_address,
-    default_limits=[f"{settings.RATE_LIMIT_PER_MINUTE}/minute"],
+    default_limits=[_RATE_LIMIT],
     storage_uri=settings.VALKEY_URL,
+    # Every rate-limited request hits Valkey: keep pooled connections alive
+    storage_options={"max_connections": 50, "socket_keepalive": True},
+    # Single INCR (+EXPIRE in one script) per hit; moving-window needs sorted sets
+    strategy="fixed-window",
 )
 
 
 def get_rate_limit_string() -> str:
     """Get current rate limit as string for dynamic updates."""
-    return f"{settings.RATE_LIMIT_PER_MINUTE}/minute"
+    return _RATE_LIMIT
@@ -1,36 +1,51 @@
 """Auth router with security enhancements."""
 
 import secrets
-
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import RedirectResponse
-from sqlalchemy import select
+import string
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from html import escape
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi.responses import HTMLResponse, RedirectResponse
+from pydantic import ValidationError
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload
 
 from app.audit import AuditLogger, AuthEventType
 from app.config import get_settings
 from app.db.session import get_db
 from app.models import OAuthAccount, User
-from app.valkey import OAuthStateStore
+from app.valkey import LinkedAccountsCache, OAuthStateStore, UserCache
 from app.webhooks.emitter import WebhookEmitter
 
-from .jwt import get_current_user
+from .jwt import CurrentUser, get_current_user
+from .mock_oauth import MockOAuthUser, get_mock_user
 from .oauth import (
     DiscordOAuth,
     FacebookOAuth,
     GitHubOAuth,
     GoogleOAuth,
     LinkedInOAuth,
+    OAuthProvider,
     SlackOAuth,
     TwitchOAuth,
     XOAuth,
 )
-from .pkce import generate_code_challenge, generate_code_verifier
+from .pkce import generate_state_and_pkce
 from .rate_limit import limiter
 from .schemas import (
+    DiscordUserInfo,
+    FacebookUserInfo,
+    GitHubUserInfo,
+    OIDCUserInfo,
+    ProviderUserInfo,
     RefreshTokenRequest,
     TokenPairResponse,
+    TwitchUserInfo,
+    XUserInfo,
 )
 from .tokens import (
     create_access_token,
@@ -45,650 +60,175 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 # API prefix for building URLs
 API_V1_PREFIX = "/api/v1"
 
+# In development, redirect to debug page to show tokens
+# In production, redirect to frontend
+DEBUG_REDIRECT_BASE = f"{settings.API_URL}{API_V1_PREFIX}/auth/debug-tokens"
+FRONTEND_CALLBACK_BASE = f"{settings.FRONTEND_URL}/auth/callback"
+IS_DEV = settings.FRONTEND_URL.startswith("http://localhost")
+TOKEN_REDIRECT_BASE = DEBUG_REDIRECT_BASE if IS_DEV else FRONTEND_CALLBACK_BASE
 
-def _get_client_info(request: Request) -> tuple[str | None, str | None]:
-    """Extract device info and IP address from request."""
-    device_info = request.headers.get("User-Agent")
-    ip_address = request.client.host if request.client else None
-    return device_info, ip_address
-
-
-@router.get("/google")
-@limiter.limit("10/minute")
-async def google_login(request: Request):
-    """Start Google OAuth flow with PKCE."""
-    state = secrets.token_urlsafe(32)
-    code_verifier = generate_code_verifier()
-    code_challenge = generate_code_challenge(code_verifier)
-
-    # Store state with code_verifier in Valkey
-    await OAuthStateStore.save(state, "google", code_verifier)
-
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/google/callback"
-    authorize_url = GoogleOAuth.get_authorize_url(redirect_uri, state, code_challenge)
-
-    return RedirectResponse(url=authorize_url)
-
-
-@router.get("/google/callback")
-@limiter.limit("10/minute")
-async def google_callback(
-    request: Request,
-    code: str,
-    state: str,
-    db: AsyncSession = Depends(get_db),
-):
-    """Handle Google OAuth callback."""
-    device_info, ip_address = _get_client_info(request)
-
-    # Verify and consume state
-    state_data = await OAuthStateStore.get_and_delete(state)
-    if not state_data or state_data.get("provider") != "google":
-        await AuditLogger.log_login(
-            db, None, "google", False, ip_address, device_info, "Invalid state"
-        )
-        raise HTTPException(status_code=400, detail="Invalid or expired state")
-
-    code_verifier = state_data.get("code_verifier")
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/google/callback"
-
-    # Exchange code for tokens
-    token_data = await GoogleOAuth.exchange_code(code, redirect_uri, code_verifier)
-    if not token_data:
-        await AuditLogger.log_login(
-            db, None, "google", False, ip_address, device_info, "Code exchange failed"
-        )
-        raise HTTPException(status_code=400, detail="Failed to exchange code")
 
-    # Get user info
-    user_info = await GoogleOAuth.get_user_info(token_data["access_token"])
-    if not user_info:
-        await AuditLogger.log_login(
-            db, None, "google", False, ip_address, device_info, "Failed to get user info"
-        )
-        raise HTTPException(status_code=400, detail="Failed to get user info")
+# Tokens ride in the redirect URL: keep it out of caches and Referer headers
+_TOKEN_REDIRECT_HEADERS = {"cache-control": "no-store", "referrer-policy": "no-referrer"}
 
-    # Find or create user
-    user = await _find_or_create_user(
-        db=db,
-        provider="google",
-        provider_user_id=user_info["id"],
-        email=user_info["email"],
-        display_name=user_info.get("name"),
-        avatar_url=user_info.get("picture"),
-        access_token=token_data["access_token"],
-        refresh_token=token_data.get("refresh_token"),
-    )
-
-    # Create tokens
-    access_token = create_access_token(str(user.id), user.email)
-    refresh_token = await create_refresh_token(db, user.id, device_info, ip_address)
 
-    # Log successful login
-    await AuditLogger.log_login(db, user.id, "google", True, ip_address, device_info)
-    await AuditLogger.log_event(
-        db, AuthEventType.LOGIN_SUCCESS, user.id, {"provider": "google"}, ip_address, device_info
+def _oauth_redirect(access_token: str, refresh_token: str) -> RedirectResponse:
+    """Redirect the browser to the token landing page (debug page in dev)."""
+    query = urlencode({"access_token": access_token, "refresh_token": refresh_token})
+    return RedirectResponse(
+        url=f"{TOKEN_REDIRECT_BASE}?{query}", status_code=302, headers=_TOKEN_REDIRECT_HEADERS
     )
 
-    # Emit webhook event
-    await WebhookEmitter.emit_user_event("user.login", user.id, {"provider": "google"})
-
-    # In development, redirect to debug page to show tokens
-    # In production, redirect to frontend
-    if settings.FRONTEND_URL.startswith("http://localhost"):
-        return RedirectResponse(
-            url=f"{settings.API_URL}{API_V1_PREFIX}/auth/debug-tokens"
-            f"?access_token={access_token}&refresh_token={refresh_token}"
-        )
-
-    frontend_url = (
-        f"{settings.FRONTEND_URL}/auth/callback"
-        f"?access_token={access_token}&refresh_token={refresh_token}"
-    )
-    return RedirectResponse(url=frontend_url)
-
-
-@router.get("/discord")
-@limiter.limit("10/minute")
-async def discord_login(request: Request):
-    """Start Discord OAuth flow with PKCE."""
-    state = secrets.token_urlsafe(32)
-    code_verifier = generate_code_verifier()
-    code_challenge = generate_code_challenge(code_verifier)
-
-    # Store state with code_verifier in Valkey
-    await OAuthStateStore.save(state, "discord", code_verifier)
-
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/discord/callback"
-    authorize_url = DiscordOAuth.get_authorize_url(redirect_uri, state, code_challenge)
-
-    return RedirectResponse(url=authorize_url)
-
-
-@router.get("/discord/callback")
-@limiter.limit("10/minute")
-async def discord_callback(
-    request: Request,
-    code: str,
-    state: str,
-    db: AsyncSession = Depends(get_db),
-):
-    """Handle Discord OAuth callback."""
-    device_info, ip_address = _get_client_info(request)
-
-    # Verify and consume state
-    state_data = await OAuthStateStore.get_and_delete(state)
-    if not state_data or state_data.get("provider") != "discord":
-        await AuditLogger.log_login(
-            db, None, "discord", False, ip_address, device_info, "Invalid state"
-        )
-        raise HTTPException(status_code=400, detail="Invalid or expired state")
-
-    code_verifier = state_data.get("code_verifier")
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/discord/callback"
-
-    # Exchange code for tokens with PKCE verifier
-    token_data = await DiscordOAuth.exchange_code(code, redirect_uri, code_verifier)
-    if not token_data:
-        await AuditLogger.log_login(
-            db, None, "discord", False, ip_address, device_info, "Code exchange failed"
-        )
-        raise HTTPException(status_code=400, detail="Failed to exchange code")
-
-    # Get user info
-    user_info = await DiscordOAuth.get_user_info(token_data["access_token"])
-    if not user_info:
-        await AuditLogger.log_login(
-            db, None, "discord", False, ip_address, device_info, "Failed to get user info"
-        )
-        raise HTTPException(status_code=400, detail="Failed to get user info")
-
-    # Find or create user
-    user = await _find_or_create_user(
-        db=db,
-        provider="discord",
-        provider_user_id=user_info["id"],
-        email=user_info["email"],
-        display_name=user_info.get("username"),
-        avatar_url=user_info.get("avatar_url"),
-        access_token=token_data["access_token"],
-        refresh_token=token_data.get("refresh_token"),
-    )
-
-    # Create tokens
-    access_token = create_access_token(str(user.id), user.email)
-    refresh_token = await create_refresh_token(db, user.id, device_info, ip_address)
-
-    # Log successful login
-    await AuditLogger.log_login(db, user.id, "discord", True, ip_address, device_info)
-    await AuditLogger.log_event(
-        db, AuthEventType.LOGIN_SUCCESS, user.id, {"provider": "discord"}, ip_address, device_info
-    )
-
-    # Emit webhook event
-    await WebhookEmitter.emit_user_event("user.login", user.id, {"provider": "discord"})
-
-    # In development, redirect to debug page to show tokens
-    # In production, redirect to frontend
-    if settings.FRONTEND_URL.startswith("http://localhost"):
-        return RedirectResponse(
-            url=f"{settings.API_URL}{API_V1_PREFIX}/auth/debug-tokens"
-            f"?access_token={access_token}&refresh_token={refresh_token}"
-        )
 
-    frontend_url = (
-        f"{settings.FRONTEND_URL}/auth/callback"
-        f"?access_token={access_token}&refresh_token={refresh_token}"
-    )
-    return RedirectResponse(url=frontend_url)
-
-
-@router.get("/github")
-@limiter.limit("10/minute")
-async def github_login(request: Request):
-    """Start GitHub OAuth flow with PKCE."""
-    state = secrets.token_urlsafe(32)
-    code_verifier = generate_code_verifier()
-    code_challenge = generate_code_challenge(code_verifier)
-
-    # Store state with code_verifier in Valkey
-    await OAuthStateStore.save(state, "github", code_verifier)
-
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/github/callback"
-    authorize_url = GitHubOAuth.get_authorize_url(redirect_uri, state, code_challenge)
-
-    return RedirectResponse(url=authorize_url)
-
-
-@router.get("/github/callback")
-@limiter.limit("10/minute")
-async def github_callback(
-    request: Request,
-    code: str,
-    state: str,
-    db: AsyncSession = Depends(get_db),
-):
-    """Handle GitHub OAuth callback."""
-    device_info, ip_address = _get_client_info(request)
-
-    # Verify and consume state
-    state_data = await OAuthStateStore.get_and_delete(state)
-    if not state_data or state_data.get("provider") != "github":
-        await AuditLogger.log_login(
-            db, None, "github", False, ip_address, device_info, "Invalid state"
-        )
-        raise HTTPException(status_code=400, detail="Invalid or expired state")
-
-    code_verifier = state_data.get("code_verifier")
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/github/callback"
+def _get_client_info(request: Request) -> tuple[str | None, str | None]:
+    """Extract device info and IP address from request."""
+    device_info = request.headers.get("user-agent")
+    ip_address = request.client.host if request.client else None
+    return device_info, ip_address
 
-    # Exchange code for tokens
-    token_data = await GitHubOAuth.exchange_code(code, redirect_uri, code_verifier)
-    if not token_data:
-        await AuditLogger.log_login(
-            db, None, "github", False, ip_address, device_info, "Code exchange failed"
-        )
-        raise HTTPException(status_code=400, detail="Failed to exchange code")
 
-    # Get user info
-    user_info = await GitHubOAuth.get_user_info(token_data["access_token"])
+@dataclass(frozen=True)
+class LoginProvider:
+    """How one OAuth provider plugs into the shared login/callback handlers."""
+
+    label: str
+    oauth: type[OAuthProvider]
+    user_info: type[ProviderUserInfo]
+    mock_format: Callable[[MockOAuthUser], Mapping]
+    # OpenID Connect providers that take a nonce on the authorize URL
+    nonce: bool = False
+
+
+PROVIDERS: dict[str, LoginProvider] = {
+    "google": LoginProvider(
+        "Google",
+        GoogleOAuth,
+        ProviderUserInfo,
+        MockOAuthUser.to_google_format,
+    ),
+    "discord": LoginProvider(
+        "Discord",
+        DiscordOAuth,
+        DiscordUserInfo,
+        MockOAuthUser.to_discord_format,
+    ),
+    "github": LoginProvider(
+        "GitHub",
+        GitHubOAuth,
+        GitHubUserInfo,
+        MockOAuthUser.to_github_format,
+    ),
+    "x": LoginProvider("X (Twitter)", XOAuth, XUserInfo, MockOAuthUser.to_x_format),
+    # LinkedIn and Slack use OpenID Connect format with "sub"
+    "linkedin": LoginProvider(
+        "LinkedIn",
+        LinkedInOAuth,
+        OIDCUserInfo,
+        MockOAuthUser.to_linkedin_format,
+    ),
+    "facebook": LoginProvider(
+        "Facebook",
+        FacebookOAuth,
+        FacebookUserInfo,
+        MockOAuthUser.to_facebook_format,
+    ),
+    "slack": LoginProvider(
+        "Slack",
+        SlackOAuth,
+        OIDCUserInfo,
+        MockOAuthUser.to_slack_format,
+        nonce=True,
+    ),
+    "twitch": LoginProvider(
+        "Twitch",
+        TwitchOAuth,
+        TwitchUserInfo,
+        MockOAuthUser.to_twitch_format,
+        nonce=True,
+    ),
+}
+
+
+# Callback URL registered with each provider
+REDIRECT_URIS = {
+    name: f"{settings.API_URL}{API_V1_PREFIX}/auth/{name}/callback" for name in PROVIDERS
+}
+
+
+def _validate_user_info(
+    provider: LoginProvider, user_info: Mapping | None
+) -> ProviderUserInfo | None:
+    """Normalize a provider's userinfo payload; None if it is missing or malformed."""
     if not user_info:
-        await AuditLogger.log_login(
-            db, None, "github", False, ip_address, device_info, "Failed to get user info"
-        )
-        raise HTTPException(status_code=400, detail="Failed to get user info")
-
-    # Find or create user
-    user = await _find_or_create_user(
-        db=db,
-        provider="github",
-        provider_user_id=str(user_info["id"]),
-        email=user_info["email"],
-        display_name=user_info.get("name") or user_info.get("login"),
-        avatar_url=user_info.get("avatar_url"),
-        access_token=token_data["access_token"],
-        refresh_token=token_data.get("refresh_token"),
-    )
-
-    # Create tokens
-    access_token = create_access_token(str(user.id), user.email)
-    refresh_token = await create_refresh_token(db, user.id, device_info, ip_address)
-
-    # Log successful login
-    await AuditLogger.log_login(db, user.id, "github", True, ip_address, device_info)
-    await AuditLogger.log_event(
-        db, AuthEventType.LOGIN_SUCCESS, user.id, {"provider": "github"}, ip_address, device_info
-    )
-
-    # Emit webhook event
-    await WebhookEmitter.emit_user_event("user.login", user.id, {"provider": "github"})
-
-    # In development, redirect to debug page to show tokens
-    # In production, redirect to frontend
-    if settings.FRONTEND_URL.startswith("http://localhost"):
-        return RedirectResponse(
-            url=f"{settings.API_URL}{API_V1_PREFIX}/auth/debug-tokens"
-            f"?access_token={access_token}&refresh_token={refresh_token}"
-        )
-
-    frontend_url = (
-        f"{settings.FRONTEND_URL}/auth/callback"
-        f"?access_token={access_token}&refresh_token={refresh_token}"
-    )
-    return RedirectResponse(url=frontend_url)
+        return None
+    try:
+        return provider.user_info.model_validate(user_info)
+    except ValidationError:
+        return None
 
 
-@router.get("/x")
-@limiter.limit("10/minute")
-async def x_login(request: Request):
-    """Start X (Twitter) OAuth flow with PKCE."""
-    state = secrets.token_urlsafe(32)
-    code_verifier = generate_code_verifier()
-    code_challenge = generate_code_challenge(code_verifier)
+async def _start_oauth_login(name: str, provider: LoginProvider) -> RedirectResponse:
+    """Store state + PKCE verifier and redirect to the provider."""
+    state, code_verifier, code_challenge = generate_state_and_pkce()
 
     # Store state with code_verifier in Valkey
-    await OAuthStateStore.save(state, "x", code_verifier)
-
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/x/callback"
-    authorize_url = XOAuth.get_authorize_url(redirect_uri, state, code_challenge)
-
-    return RedirectResponse(url=authorize_url)
-
-
-@router.get("/x/callback")
-@limiter.limit("10/minute")
-async def x_callback(
-    request: Request,
-    code: str,
-    state: str,
-    db: AsyncSession = Depends(get_db),
-):
-    """Handle X (Twitter) OAuth callback."""
-    device_info, ip_address = _get_client_info(request)
+    await OAuthStateStore.save(state, name, code_verifier)
 
-    # Verify and consume state
-    state_data = await OAuthStateStore.get_and_delete(state)
-    if not state_data or state_data.get("provider") != "x":
-        await AuditLogger.log_login(db, None, "x", False, ip_address, device_info, "Invalid state")
-        raise HTTPException(status_code=400, detail="Invalid or expired state")
-
-    code_verifier = state_data.get("code_verifier")
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/x/callback"
-
-    # Exchange code for tokens
-    token_data = await XOAuth.exchange_code(code, redirect_uri, code_verifier)
-    if not token_data:
-        await AuditLogger.log_login(
-            db, None, "x", False, ip_address, device_info, "Code exchange failed"
+    redirect_uri = REDIRECT_URIS[name]
+    if provider.nonce:
+        authorize_url = provider.oauth.get_authorize_url(
+            redirect_uri, state, code_challenge, secrets.token_urlsafe(16)
         )
-        raise HTTPException(status_code=400, detail="Failed to exchange code")
-
-    # Get user info
-    user_info = await XOAuth.get_user_info(token_data["access_token"])
-    if not user_info:
-        await AuditLogger.log_login(
-            db, None, "x", False, ip_address, device_info, "Failed to get user info"
-        )
-        raise HTTPException(status_code=400, detail="Failed to get user info")
-
-    # X doesn't provide email, generate placeholder
-    username = user_info.get("username", "unknown")
-    email = f"{username}@x.yesod-auth.local"
-
-    # Find or create user
-    user = await _find_or_create_user(
-        db=db,
-        provider="x",
-        provider_user_id=user_info["id"],
-        email=email,
-        display_name=user_info.get("name") or username,
-        avatar_url=user_info.get("profile_image_url"),
-        access_token=token_data["access_token"],
-        refresh_token=token_data.get("refresh_token"),
-    )
-
-    # Create tokens
-    access_token = create_access_token(str(user.id), user.email)
-    refresh_token = await create_refresh_token(db, user.id, device_info, ip_address)
-
-    # Log successful login
-    await AuditLogger.log_login(db, user.id, "x", True, ip_address, device_info)
-    await AuditLogger.log_event(
-        db, AuthEventType.LOGIN_SUCCESS, user.id, {"provider": "x"}, ip_address, device_info
-    )
-
-    # Emit webhook event
-    await WebhookEmitter.emit_user_event("user.login", user.id, {"provider": "x"})
-
-    # In development, redirect to debug page to show tokens
-    # In production, redirect to frontend
-    if settings.FRONTEND_URL.startswith("http://localhost"):
-        return RedirectResponse(
-            url=f"{settings.API_URL}{API_V1_PREFIX}/auth/debug-tokens"
-            f"?access_token={access_token}&refresh_token={refresh_token}"
-        )
-
-    frontend_url = (
-        f"{settings.FRONTEND_URL}/auth/callback"
-        f"?access_token={access_token}&refresh_token={refresh_token}"
-    )
-    return RedirectResponse(url=frontend_url)
-
-
-@router.get("/linkedin")
-@limiter.limit("10/minute")
-async def linkedin_login(request: Request):
-    """Start LinkedIn OAuth flow with PKCE."""
-    state = secrets.token_urlsafe(32)
-    code_verifier = generate_code_verifier()
-    code_challenge = generate_code_challenge(code_verifier)
-
-    # Store state with code_verifier in Valkey
-    await OAuthStateStore.save(state, "linkedin", code_verifier)
-
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/linkedin/callback"
-    authorize_url = LinkedInOAuth.get_authorize_url(redirect_uri, state, code_challenge)
+    else:
+        authorize_url = provider.oauth.get_authorize_url(redirect_uri, state, code_challenge)
 
     return RedirectResponse(url=authorize_url)
 
 
-@router.get("/linkedin/callback")
-@limiter.limit("10/minute")
-async def linkedin_callback(
+async def _handle_oauth_callback(
+    name: str,
+    provider: LoginProvider,
     request: Request,
     code: str,
     state: str,
-    db: AsyncSession = Depends(get_db),
-):
-    """Handle LinkedIn OAuth callback."""
+    db: AsyncSession,
+    background_tasks: BackgroundTasks,
+) -> RedirectResponse:
+    """Verify state, exchange the code, sign the user in and redirect with tokens."""
     device_info, ip_address = _get_client_info(request)
 
     # Verify and consume state
     state_data = await OAuthStateStore.get_and_delete(state)
-    if not state_data or state_data.get("provider") != "linkedin":
-        await AuditLogger.log_login(
-            db, None, "linkedin", False, ip_address, device_info, "Invalid state"
-        )
+    if not state_data or state_data.get("provider") != name:
+        await AuditLogger.log_login(db, None, name, False, ip_address, device_info, "Invalid state")
         raise HTTPException(status_code=400, detail="Invalid or expired state")
 
     code_verifier = state_data.get("code_verifier")
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/linkedin/callback"
+    redirect_uri = REDIRECT_URIS[name]
 
-    # Exchange code for tokens
-    token_data = await LinkedInOAuth.exchange_code(code, redirect_uri, code_verifier)
+    # Exchange code for tokens with PKCE verifier
+    token_data = await provider.oauth.exchange_code(code, redirect_uri, code_verifier)
     if not token_data:
         await AuditLogger.log_login(
-            db, None, "linkedin", False, ip_address, device_info, "Code exchange failed"
+            db, None, name, False, ip_address, device_info, "Code exchange failed"
         )
         raise HTTPException(status_code=400, detail="Failed to exchange code")
 
     # Get user info
-    user_info = await LinkedInOAuth.get_user_info(token_data["access_token"])
-    if not user_info:
-        await AuditLogger.log_login(
-            db, None, "linkedin", False, ip_address, device_info, "Failed to get user info"
-        )
-        raise HTTPException(status_code=400, detail="Failed to get user info")
-
-    # Find or create user (LinkedIn uses OpenID Connect format)
-    user = await _find_or_create_user(
-        db=db,
-        provider="linkedin",
-        provider_user_id=user_info["sub"],
-        email=user_info["email"],
-        display_name=user_info.get("name"),
-        avatar_url=user_info.get("picture"),
-        access_token=token_data["access_token"],
-        refresh_token=token_data.get("refresh_token"),
+    user_info = _validate_user_info(
+        provider, await provider.oauth.get_user_info(token_data["access_token"])
     )
-
-    # Create tokens
-    access_token = create_access_token(str(user.id), user.email)
-    refresh_token = await create_refresh_token(db, user.id, device_info, ip_address)
-
-    # Log successful login
-    await AuditLogger.log_login(db, user.id, "linkedin", True, ip_address, device_info)
-    await AuditLogger.log_event(
-        db, AuthEventType.LOGIN_SUCCESS, user.id, {"provider": "linkedin"}, ip_address, device_info
-    )
-
-    # Emit webhook event
-    await WebhookEmitter.emit_user_event("user.login", user.id, {"provider": "linkedin"})
-
-    # In development, redirect to debug page to show tokens
-    # In production, redirect to frontend
-    if settings.FRONTEND_URL.startswith("http://localhost"):
-        return RedirectResponse(
-            url=f"{settings.API_URL}{API_V1_PREFIX}/auth/debug-tokens"
-            f"?access_token={access_token}&refresh_token={refresh_token}"
-        )
-
-    frontend_url = (
-        f"{settings.FRONTEND_URL}/auth/callback"
-        f"?access_token={access_token}&refresh_token={refresh_token}"
-    )
-    return RedirectResponse(url=frontend_url)
-
-
-@router.get("/facebook")
-@limiter.limit("10/minute")
-async def facebook_login(request: Request):
-    """Start Facebook OAuth flow with PKCE."""
-    state = secrets.token_urlsafe(32)
-    code_verifier = generate_code_verifier()
-    code_challenge = generate_code_challenge(code_verifier)
-
-    # Store state with code_verifier in Valkey
-    await OAuthStateStore.save(state, "facebook", code_verifier)
-
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/facebook/callback"
-    authorize_url = FacebookOAuth.get_authorize_url(redirect_uri, state, code_challenge)
-
-    return RedirectResponse(url=authorize_url)
-
-
-@router.get("/facebook/callback")
-@limiter.limit("10/minute")
-async def facebook_callback(
-    request: Request,
-    code: str,
-    state: str,
-    db: AsyncSession = Depends(get_db),
-):
-    """Handle Facebook OAuth callback."""
-    device_info, ip_address = _get_client_info(request)
-
-    # Verify and consume state
-    state_data = await OAuthStateStore.get_and_delete(state)
-    if not state_data or state_data.get("provider") != "facebook":
-        await AuditLogger.log_login(
-            db, None, "facebook", False, ip_address, device_info, "Invalid state"
-        )
-        raise HTTPException(status_code=400, detail="Invalid or expired state")
-
-    code_verifier = state_data.get("code_verifier")
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/facebook/callback"
-
-    # Exchange code for tokens
-    token_data = await FacebookOAuth.exchange_code(code, redirect_uri, code_verifier)
-    if not token_data:
-        await AuditLogger.log_login(
-            db, None, "facebook", False, ip_address, device_info, "Code exchange failed"
-        )
-        raise HTTPException(status_code=400, detail="Failed to exchange code")
-
-    # Get user info
-    user_info = await FacebookOAuth.get_user_info(token_data["access_token"])
-    if not user_info:
+    if user_info is None:
         await AuditLogger.log_login(
-            db, None, "facebook", False, ip_address, device_info, "Failed to get user info"
+            db, None, name, False, ip_address, device_info, "Failed to get user info"
         )
         raise HTTPException(status_code=400, detail="Failed to get user info")
 
     # Find or create user
     user = await _find_or_create_user(
         db=db,
-        provider="facebook",
-        provider_user_id=user_info["id"],
-        email=user_info["email"],
-        display_name=user_info.get("name"),
-        avatar_url=user_info.get("picture", {}).get("data", {}).get("url"),
-        access_token=token_data["access_token"],
-        refresh_token=token_data.get("refresh_token"),
-    )
-
-    # Create tokens
-    access_token = create_access_token(str(user.id), user.email)
-    refresh_token = await create_refresh_token(db, user.id, device_info, ip_address)
-
-    # Log successful login
-    await AuditLogger.log_login(db, user.id, "facebook", True, ip_address, device_info)
-    await AuditLogger.log_event(
-        db, AuthEventType.LOGIN_SUCCESS, user.id, {"provider": "facebook"}, ip_address, device_info
-    )
-
-    # Emit webhook event
-    await WebhookEmitter.emit_user_event("user.login", user.id, {"provider": "facebook"})
-
-    # In development, redirect to debug page to show tokens
-    # In production, redirect to frontend
-    if settings.FRONTEND_URL.startswith("http://localhost"):
-        return RedirectResponse(
-            url=f"{settings.API_URL}{API_V1_PREFIX}/auth/debug-tokens"
-            f"?access_token={access_token}&refresh_token={refresh_token}"
-        )
-
-    frontend_url = (
-        f"{settings.FRONTEND_URL}/auth/callback"
-        f"?access_token={access_token}&refresh_token={refresh_token}"
-    )
-    return RedirectResponse(url=frontend_url)
-
-
-@router.get("/slack")
-@limiter.limit("10/minute")
-async def slack_login(request: Request):
-    """Start Slack OAuth flow with PKCE."""
-    state = secrets.token_urlsafe(32)
-    code_verifier = generate_code_verifier()
-    code_challenge = generate_code_challenge(code_verifier)
-    nonce = secrets.token_urlsafe(16)
-
-    # Store state with code_verifier in Valkey
-    await OAuthStateStore.save(state, "slack", code_verifier)
-
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/slack/callback"
-    authorize_url = SlackOAuth.get_authorize_url(redirect_uri, state, code_challenge, nonce)
-
-    return RedirectResponse(url=authorize_url)
-
-
-@router.get("/slack/callback")
-@limiter.limit("10/minute")
-async def slack_callback(
-    request: Request,
-    code: str,
-    state: str,
-    db: AsyncSession = Depends(get_db),
-):
-    """Handle Slack OAuth callback."""
-    device_info, ip_address = _get_client_info(request)
-
-    # Verify and consume state
-    state_data = await OAuthStateStore.get_and_delete(state)
-    if not state_data or state_data.get("provider") != "slack":
-        await AuditLogger.log_login(
-            db, None, "slack", False, ip_address, device_info, "Invalid state"
-        )
-        raise HTTPException(status_code=400, detail="Invalid or expired state")
-
-    code_verifier = state_data.get("code_verifier")
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/slack/callback"
-
-    # Exchange code for tokens with PKCE verifier
-    token_data = await SlackOAuth.exchange_code(code, redirect_uri, code_verifier)
-    if not token_data:
-        await AuditLogger.log_login(
-            db, None, "slack", False, ip_address, device_info, "Code exchange failed"
-        )
-        raise HTTPException(status_code=400, detail="Failed to exchange code")
-
-    # Get user info
-    user_info = await SlackOAuth.get_user_info(token_data["access_token"])
-    if not user_info:
-        await AuditLogger.log_login(
-            db, None, "slack", False, ip_address, device_info, "Failed to get user info"
-        )
-        raise HTTPException(status_code=400, detail="Failed to get user info")
-
-    # Find or create user (Slack uses OpenID Connect format with "sub")
-    user = await _find_or_create_user(
-        db=db,
-        provider="slack",
-        provider_user_id=user_info["sub"],
-        email=user_info["email"],
-        display_name=user_info.get("name"),
-        avatar_url=user_info.get("picture"),
+        provider=name,
+        **user_info.model_dump(),
         access_token=token_data["access_token"],
         refresh_token=token_data.get("refresh_token"),
     )
@@ -698,123 +238,49 @@ async def slack_callback(
     refresh_token = await create_refresh_token(db, user.id, device_info, ip_address)
 
     # Log successful login
-    await AuditLogger.log_login(db, user.id, "slack", True, ip_address, device_info)
+    await AuditLogger.log_login(db, user.id, name, True, ip_address, device_info)
     await AuditLogger.log_event(
-        db, AuthEventType.LOGIN_SUCCESS, user.id, {"provider": "slack"}, ip_address, device_info
+        db, AuthEventType.LOGIN_SUCCESS, user.id, {"provider": name}, ip_address, device_info
     )
 
-    # Emit webhook event
-    await WebhookEmitter.emit_user_event("user.login", user.id, {"provider": "slack"})
-
-    # In development, redirect to debug page to show tokens
-    # In production, redirect to frontend
-    if settings.FRONTEND_URL.startswith("http://localhost"):
-        return RedirectResponse(
-            url=f"{settings.API_URL}{API_V1_PREFIX}/auth/debug-tokens"
-            f"?access_token={access_token}&refresh_token={refresh_token}"
-        )
-
-    frontend_url = (
-        f"{settings.FRONTEND_URL}/auth/callback"
-        f"?access_token={access_token}&refresh_token={refresh_token}"
+    # Emit webhook event after the redirect is sent; audit records are already
+    # queued to the background writer, so nothing else is left on the response path
+    background_tasks.add_task(
+        WebhookEmitter.emit_user_event, "user.login", user.id, {"provider": name}
     )
-    return RedirectResponse(url=frontend_url)
 
+    return _oauth_redirect(access_token, refresh_token)
 
-@router.get("/twitch")
-@limiter.limit("10/minute")
-async def twitch_login(request: Request):
-    """Start Twitch OAuth flow with PKCE."""
-    state = secrets.token_urlsafe(32)
-    code_verifier = generate_code_verifier()
-    code_challenge = generate_code_challenge(code_verifier)
-    nonce = secrets.token_urlsafe(16)
 
-    # Store state with code_verifier in Valkey
-    await OAuthStateStore.save(state, "twitch", code_verifier)
+def _register_provider_routes(name: str, provider: LoginProvider) -> None:
+    """Add the /{name} and /{name}/callback routes for one provider."""
 
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/twitch/callback"
-    authorize_url = TwitchOAuth.get_authorize_url(redirect_uri, state, code_challenge, nonce)
+    async def login(request: Request):
+        return await _start_oauth_login(name, provider)
 
-    return RedirectResponse(url=authorize_url)
-
-
-@router.get("/twitch/callback")
-@limiter.limit("10/minute")
-async def twitch_callback(
-    request: Request,
-    code: str,
-    state: str,
-    db: AsyncSession = Depends(get_db),
-):
-    """Handle Twitch OAuth callback."""
-    device_info, ip_address = _get_client_info(request)
-
-    # Verify and consume state
-    state_data = await OAuthStateStore.get_and_delete(state)
-    if not state_data or state_data.get("provider") != "twitch":
-        await AuditLogger.log_login(
-            db, None, "twitch", False, ip_address, device_info, "Invalid state"
+    async def callback(
+        request: Request,
+        code: str,
+        state: str,
+        background_tasks: BackgroundTasks,
+        db: AsyncSession = Depends(get_db),
+    ):
+        return await _handle_oauth_callback(
+            name, provider, request, code, state, db, background_tasks
         )
-        raise HTTPException(status_code=400, detail="Invalid or expired state")
-
-    code_verifier = state_data.get("code_verifier")
-    redirect_uri = f"{settings.API_URL}{API_V1_PREFIX}/auth/twitch/callback"
-
-    # Exchange code for tokens with PKCE verifier
-    token_data = await TwitchOAuth.exchange_code(code, redirect_uri, code_verifier)
-    if not token_data:
-        await AuditLogger.log_login(
-            db, None, "twitch", False, ip_address, device_info, "Code exchange failed"
-        )
-        raise HTTPException(status_code=400, detail="Failed to exchange code")
-
-    # Get user info
-    user_info = await TwitchOAuth.get_user_info(token_data["access_token"])
-    if not user_info:
-        await AuditLogger.log_login(
-            db, None, "twitch", False, ip_address, device_info, "Failed to get user info"
-        )
-        raise HTTPException(status_code=400, detail="Failed to get user info")
-
-    # Find or create user
-    user = await _find_or_create_user(
-        db=db,
-        provider="twitch",
-        provider_user_id=user_info["id"],
-        email=user_info["email"],
-        display_name=user_info.get("display_name") or user_info.get("login"),
-        avatar_url=user_info.get("profile_image_url"),
-        access_token=token_data["access_token"],
-        refresh_token=token_data.get("refresh_token"),
-    )
-
-    # Create tokens
-    access_token = create_access_token(str(user.id), user.email)
-    refresh_token = await create_refresh_token(db, user.id, device_info, ip_address)
 
-    # Log successful login
-    await AuditLogger.log_login(db, user.id, "twitch", True, ip_address, device_info)
-    await AuditLogger.log_event(
-        db, AuthEventType.LOGIN_SUCCESS, user.id, {"provider": "twitch"}, ip_address, device_info
-    )
+    # Unique names keep OpenAPI operation ids and per-route rate limit buckets apart
+    login.__name__ = login.__qualname__ = f"{name}_login"
+    login.__doc__ = f"Start {provider.label} OAuth flow with PKCE."
+    callback.__name__ = callback.__qualname__ = f"{name}_callback"
+    callback.__doc__ = f"Handle {provider.label} OAuth callback."
 
-    # Emit webhook event
-    await WebhookEmitter.emit_user_event("user.login", user.id, {"provider": "twitch"})
+    router.add_api_route(f"/{name}", limiter.limit("10/minute")(login), methods=["GET"])
+    router.add_api_route(f"/{name}/callback", limiter.limit("10/minute")(callback), methods=["GET"])
 
-    # In development, redirect to debug page to show tokens
-    # In production, redirect to frontend
-    if settings.FRONTEND_URL.startswith("http://localhost"):
-        return RedirectResponse(
-            url=f"{settings.API_URL}{API_V1_PREFIX}/auth/debug-tokens"
-            f"?access_token={access_token}&refresh_token={refresh_token}"
-        )
 
-    frontend_url = (
-        f"{settings.FRONTEND_URL}/auth/callback"
-        f"?access_token={access_token}&refresh_token={refresh_token}"
-    )
-    return RedirectResponse(url=frontend_url)
+for _name, _provider in PROVIDERS.items():
+    _register_provider_routes(_name, _provider)
 
 
 @router.post("/refresh", response_model=TokenPairResponse)
@@ -843,17 +309,8 @@ async def refresh_tokens(
             detail="Invalid or expired refresh token",
         )
 
-    new_refresh_token, user_id = result
-
-    # Get user for access token
-    user_result = await db.execute(select(User).where(User.id == user_id))
-    user = user_result.scalar_one_or_none()
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
+    # User (with emails) comes back from the token lookup; no second query
+    new_refresh_token, user = result
 
     access_token = create_access_token(str(user.id), user.email)
 
@@ -872,7 +329,7 @@ async def refresh_tokens(
 async def logout(
     request: Request,
     body: RefreshTokenRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Logout - revoke the refresh token."""
@@ -888,30 +345,23 @@ async def logout(
     return {"message": "Logged out successfully"}
 
 
-@router.get("/debug-tokens")
-async def debug_tokens(access_token: str, refresh_token: str):
-    """Debug endpoint to display tokens after OAuth login.
-
-    Only use in development!
-    """
-    from fastapi.responses import HTMLResponse
-
-    html = f"""
+# Rendered by /debug-tokens; only the two tokens vary per request
+_DEBUG_TOKENS_PAGE = string.Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <title>YESOD Auth - Login Success</title>
         <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                   max-width: 800px; margin: 50px auto; padding: 20px; }}
-            h1 {{ color: #2563eb; }}
-            .token-box {{ background: #f3f4f6; padding: 15px; border-radius: 8px;
-                         margin: 10px 0; word-break: break-all; font-family: monospace; }}
-            .label {{ font-weight: bold; color: #374151; margin-bottom: 5px; }}
-            button {{ background: #2563eb; color: white; border: none; padding: 10px 20px;
-                     border-radius: 5px; cursor: pointer; margin: 5px; }}
-            button:hover {{ background: #1d4ed8; }}
-            .success {{ color: #059669; }}
+            body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+                   max-width: 800px; margin: 50px auto; padding: 20px; }
+            h1 { color: #2563eb; }
+            .token-box { background: #f3f4f6; padding: 15px; border-radius: 8px;
+                         margin: 10px 0; word-break: break-all; font-family: monospace; }
+            .label { font-weight: bold; color: #374151; margin-bottom: 5px; }
+            button { background: #2563eb; color: white; border: none; padding: 10px 20px;
+                     border-radius: 5px; cursor: pointer; margin: 5px; }
+            button:hover { background: #1d4ed8; }
+            .success { color: #059669; }
         </style>
     </head>
     <body>
@@ -919,11 +369,11 @@ async def debug_tokens(access_token: str, refresh_token: str):
         <p>Copy these tokens to use in the Admin API Test console:</p>
 
         <div class="label">Access Token:</div>
-        <div class="token-box" id="access">{access_token}</div>
+        <div class="token-box" id="access">$access_token</div>
         <button onclick="copyToken('access')">📋 Copy Access Token</button>
 
         <div class="label" style="margin-top: 20px;">Refresh Token:</div>
-        <div class="token-box" id="refresh">{refresh_token}</div>
+        <div class="token-box" id="refresh">$refresh_token</div>
         <button onclick="copyToken('refresh')">📋 Copy Refresh Token</button>
 
         <p style="margin-top: 30px;">
@@ -931,16 +381,27 @@ async def debug_tokens(access_token: str, refresh_token: str):
         </p>
 
         <script>
-            function copyToken(id) {{
+            function copyToken(id) {
                 const text = document.getElementById(id).innerText;
                 navigator.clipboard.writeText(text);
                 alert('Copied to clipboard!');
-            }}
+            }
         </script>
     </body>
     </html>
+""")
+
+
+@router.get("/debug-tokens")
+async def debug_tokens(access_token: str, refresh_token: str):
+    """Debug endpoint to display tokens after OAuth login.
+
+    Only use in development!
     """
-    return HTMLResponse(content=html)
+    html = _DEBUG_TOKENS_PAGE.substitute(
+        access_token=escape(access_token), refresh_token=escape(refresh_token)
+    )
+    return HTMLResponse(content=html, headers={"Cache-Control": "no-store"})
 
 
 # =============================================================================
@@ -963,23 +424,13 @@ async def mock_login(
     Available mock users: alice, bob, charlie
     Available providers: google, discord, github, x, linkedin, facebook, slack, twitch
     """
-    from .mock_oauth import get_mock_user
-
     if not settings.MOCK_OAUTH_ENABLED:
         raise HTTPException(
             status_code=403, detail="Mock OAuth is disabled. Set MOCK_OAUTH_ENABLED=1 to enable."
         )
 
-    if provider not in [
-        "google",
-        "discord",
-        "github",
-        "x",
-        "linkedin",
-        "facebook",
-        "slack",
-        "twitch",
-    ]:
+    login_provider = PROVIDERS.get(provider)
+    if login_provider is None:
         raise HTTPException(
             status_code=400,
             detail="Provider must be 'google', 'discord', 'github', 'x', 'linkedin', 'facebook', 'slack', or 'twitch'",
@@ -988,50 +439,14 @@ async def mock_login(
     device_info, ip_address = _get_client_info(request)
     mock_user = get_mock_user(user)
 
-    # Get user info in provider format
-    if provider == "google":
-        user_info = mock_user.to_google_format()
-        display_name = user_info.get("name")
-        avatar_url = user_info.get("picture")
-    elif provider == "github":
-        user_info = mock_user.to_github_format()
-        display_name = user_info.get("name") or user_info.get("login")
-        avatar_url = user_info.get("avatar_url")
-    elif provider == "x":
-        user_info = mock_user.to_x_format()
-        display_name = user_info.get("name") or user_info.get("username")
-        avatar_url = user_info.get("profile_image_url")
-    elif provider == "linkedin":
-        user_info = mock_user.to_linkedin_format()
-        display_name = user_info.get("name")
-        avatar_url = user_info.get("picture")
-    elif provider == "facebook":
-        user_info = mock_user.to_facebook_format()
-        display_name = user_info.get("name")
-        avatar_url = user_info.get("picture", {}).get("data", {}).get("url")
-    elif provider == "slack":
-        user_info = mock_user.to_slack_format()
-        display_name = user_info.get("name")
-        avatar_url = user_info.get("picture")
-    elif provider == "twitch":
-        user_info = mock_user.to_twitch_format()
-        display_name = user_info.get("display_name") or user_info.get("login")
-        avatar_url = user_info.get("profile_image_url")
-    else:
-        user_info = mock_user.to_discord_format()
-        display_name = user_info.get("username")
-        avatar_url = user_info.get("avatar_url")
+    # Map the mock user through the provider's own userinfo format
+    user_info = login_provider.mock_format(mock_user)
 
     # Find or create user
-    # LinkedIn uses "sub" instead of "id" (OpenID Connect)
-    provider_user_id = str(user_info.get("sub") or user_info.get("id"))
     db_user = await _find_or_create_user(
         db=db,
         provider=provider,
-        provider_user_id=provider_user_id,
-        email=user_info["email"],
-        display_name=display_name,
-        avatar_url=avatar_url,
+        **login_provider.user_info.model_validate(user_info).model_dump(),
         access_token="mock-access-token",
         refresh_token="mock-refresh-token",
     )
@@ -1080,6 +495,11 @@ async def list_mock_users():
     }
 
 
+# Profile is one-to-one and a user has a handful of emails: load both in the
+# same SELECT as the user. Anything else raises instead of lazy loading.
+_USER_GRAPH = (joinedload(User.profile), joinedload(User.emails), raiseload("*"))
+
+
 async def _find_or_create_user(
     db: AsyncSession,
     provider: str,
@@ -1093,47 +513,42 @@ async def _find_or_create_user(
     """Find existing user or create new one."""
     from app.models import UserEmail, UserProfile
 
-    # First, check if OAuth account exists
+    # Returning login: refresh tokens and provider info in one round trip,
+    # then load the user it belongs to
     result = await db.execute(
-        select(OAuthAccount)
-        .options(
-            selectinload(OAuthAccount.user).selectinload(User.profile),
-            selectinload(OAuthAccount.user).selectinload(User.emails),
-        )
+        update(OAuthAccount)
         .where(
             OAuthAccount.provider == provider,
             OAuthAccount.provider_user_id == provider_user_id,
         )
+        .values(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            provider_display_name=display_name,
+            provider_avatar_url=avatar_url,
+            provider_email=email,
+        )
+        .returning(OAuthAccount.user_id)
     )
-    oauth_account = result.scalar_one_or_none()
-
-    if oauth_account:
-        # Update tokens and provider info
-        oauth_account.access_token = access_token
-        oauth_account.refresh_token = refresh_token
-        oauth_account.provider_display_name = display_name
-        oauth_account.provider_avatar_url = avatar_url
-        oauth_account.provider_email = email
+    user_id = result.scalar_one_or_none()
 
+    if user_id:
         # Don't auto-update user profile - let user control their profile
-        user = oauth_account.user
+        result = await db.execute(select(User).options(*_USER_GRAPH).where(User.id == user_id))
+        user = result.unique().scalar_one()
 
         await db.commit()
+        # The provider info just rewritten is what GET /accounts lists
+        await LinkedAccountsCache.delete(user_id)
         return user
 
     # Check if user with same email exists
     result = await db.execute(
-        select(UserEmail)
-        .options(
-            selectinload(UserEmail.user).selectinload(User.profile),
-            selectinload(UserEmail.user).selectinload(User.emails),
-        )
-        .where(UserEmail.email == email)
+        select(User).join(User.emails).options(*_USER_GRAPH).where(UserEmail.email == email)
     )
-    user_email = result.scalar_one_or_none()
+    user = result.unique().scalar_one_or_none()
 
-    if user_email:
-        user = user_email.user
+    if user:
         # Link new OAuth account to existing user
         oauth_account = OAuthAccount(
             user_id=user.id,
@@ -1155,59 +570,36 @@ async def _find_or_create_user(
                 user.profile.avatar_url = avatar_url
 
         await db.commit()
+        await LinkedAccountsCache.delete(user.id)
+        # The profile may have been filled in above
+        await UserCache.delete(str(user.id))
 
         # Emit webhook for OAuth account linked
         await WebhookEmitter.emit_user_event("user.oauth_linked", user.id, {"provider": provider})
 
         return user
 
-    # Create new user with profile and email
-    user = User()
-    db.add(user)
-    await db.flush()
-
-    # Create profile with provider info
-    profile = UserProfile(
-        user_id=user.id,
-        display_name=display_name,
-        avatar_url=avatar_url,
-    )
-    db.add(profile)
-
-    # Create email
-    user_email = UserEmail(
-        user_id=user.id,
-        email=email,
-        is_primary=True,
-    )
-    db.add(user_email)
-
-    # Create OAuth account with provider info
-    oauth_account = OAuthAccount(
-        user_id=user.id,
-        provider=provider,
-        provider_user_id=provider_user_id,
-        provider_display_name=display_name,
-        provider_avatar_url=avatar_url,
-        provider_email=email,
-        access_token=access_token,
-        refresh_token=refresh_token,
+    # Create new user with profile, email and OAuth account. Building them
+    # through the relationships leaves the user fully populated after commit,
+    # so it needs no reload.
+    user = User(
+        profile=UserProfile(display_name=display_name, avatar_url=avatar_url),
+        emails=[UserEmail(email=email, is_primary=True)],
+        oauth_accounts=[
+            OAuthAccount(
+                provider=provider,
+                provider_user_id=provider_user_id,
+                provider_display_name=display_name,
+                provider_avatar_url=avatar_url,
+                provider_email=email,
+                access_token=access_token,
+                refresh_token=refresh_token,
+            )
+        ],
     )
-    db.add(oauth_account)
-
+    db.add(user)
     await db.commit()
 
-    # Reload with relationships
-    result = await db.execute(
-        select(User)
-        .options(
-            selectinload(User.profile),
-            selectinload(User.emails),
-        )
-        .where(User.id == user.id)
-    )
-    user = result.scalar_one()
-
     # Emit webhook for new user created
     await WebhookEmitter.emit_user_event(
         "user.created", user.id, {"provider": provider, "email": email}
@@ -2,8 +2,9 @@
 
 import uuid
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import AliasPath, BaseModel, ConfigDict, Field, model_validator
 
 
 class UserResponse(BaseModel):
@@ -52,3 +53,72 @@ class RefreshTokenRequest(BaseModel):
     """Request body for refresh token operations."""
 
     refresh_token: str = Field(..., description="The refresh token to use or revoke")
+
+
+class ProviderUserInfo(BaseModel):
+    """Account fields normalized from a provider's userinfo payload.
+
+    The defaults match Google's field names; subclasses remap them for other providers.
+    """
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    provider_user_id: str = Field(..., validation_alias="id")
+    email: str
+    display_name: str | None = Field(None, validation_alias="name")
+    avatar_url: str | None = Field(None, validation_alias="picture")
+    # Handle used as the display name when the provider has no name set
+    login: str | None = Field(None, exclude=True)
+
+    @model_validator(mode="after")
+    def _fall_back_to_login(self) -> "ProviderUserInfo":
+        if not self.display_name:
+            self.display_name = self.login
+        return self
+
+
+class DiscordUserInfo(ProviderUserInfo):
+    """Discord userinfo (avatar_url is built by DiscordOAuth)."""
+
+    display_name: str | None = Field(None, validation_alias="username")
+    avatar_url: str | None = None
+
+
+class GitHubUserInfo(ProviderUserInfo):
+    """GitHub userinfo; numeric id, name falls back to login."""
+
+    avatar_url: str | None = None
+
+
+class XUserInfo(ProviderUserInfo):
+    """X userinfo; X doesn't provide email, so a placeholder is generated."""
+
+    login: str = Field("unknown", validation_alias="username", exclude=True)
+    avatar_url: str | None = Field(None, validation_alias="profile_image_url")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _placeholder_email(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            username = data.get("username", "unknown")
+            data = {**data, "email": f"{username}@x.yesod-auth.local"}
+        return data
+
+
+class OIDCUserInfo(ProviderUserInfo):
+    """OpenID Connect userinfo (LinkedIn, Slack) keyed by "sub"."""
+
+    provider_user_id: str = Field(..., validation_alias="sub")
+
+
+class FacebookUserInfo(ProviderUserInfo):
+    """Facebook userinfo with the picture nested under picture.data.url."""
+
+    avatar_url: str | None = Field(None, validation_alias=AliasPath("picture", "data", "url"))
+
+
+class TwitchUserInfo(ProviderUserInfo):
+    """Twitch userinfo; display_name falls back to login."""
+
+    display_name: str | None = None
+    avatar_url: str | None = Field(None, validation_alias="profile_image_url")
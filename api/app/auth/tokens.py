@@ -5,40 +5,45 @@ import secrets
 import uuid
 from datetime import UTC, datetime, timedelta
 
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app.config import get_settings
-from app.models import RefreshToken
+from app.models import RefreshToken, User
 
 settings = get_settings()
 
+# Bound once at import; settings are immutable for the process lifetime
+_JWT_SECRET = settings.JWT_SECRET
+_JWT_ALG = settings.JWT_ALGORITHM
+_JWT_ALGS = [_JWT_ALG]
+_JWT_DECODE_OPTIONS = {"require": ["exp", "sub"]}
+_ACCESS_TOKEN_LIFETIME = timedelta(seconds=settings.ACCESS_TOKEN_LIFETIME_SECONDS)
+
 
 def create_access_token(user_id: str, email: str) -> str:
     """Create a short-lived access token (JWT)."""
-    expire = datetime.now(UTC) + timedelta(seconds=settings.ACCESS_TOKEN_LIFETIME_SECONDS)
+    expire = datetime.now(UTC) + _ACCESS_TOKEN_LIFETIME
     payload = {
         "sub": user_id,
         "email": email,
         "exp": expire,
         "type": "access",
     }
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    return jwt.encode(payload, _JWT_SECRET, algorithm=_JWT_ALG)
 
 
 def decode_access_token(token: str) -> dict | None:
     """Decode and validate access token."""
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGS, options=_JWT_DECODE_OPTIONS)
         if payload.get("type") != "access":
             return None
         return payload
-    except JWTError:
+    except InvalidTokenError:
         return None
 
 
@@ -80,20 +85,25 @@ async def create_refresh_token(
 async def validate_refresh_token(
     db: AsyncSession,
     token: str,
+    with_user: bool = False,
 ) -> RefreshToken | None:
-    """Validate refresh token and return the record if valid."""
+    """Validate refresh token and return the record if valid.
+
+    With with_user, the owning user and their emails are loaded in the same query.
+    """
     token_hash = hash_refresh_token(token)
 
-    result = await db.execute(
-        select(RefreshToken).where(
-            and_(
-                RefreshToken.token_hash == token_hash,
-                not RefreshToken.is_revoked,
-                RefreshToken.expires_at > datetime.now(UTC),
-            )
+    stmt = select(RefreshToken).where(
+        and_(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.is_revoked.is_(False),
+            RefreshToken.expires_at > datetime.now(UTC),
         )
     )
-    return result.scalar_one_or_none()
+    if with_user:
+        stmt = stmt.options(joinedload(RefreshToken.user).joinedload(User.emails))
+    result = await db.execute(stmt)
+    return result.unique().scalar_one_or_none()
 
 
 async def rotate_refresh_token(
@@ -101,9 +111,9 @@ async def rotate_refresh_token(
     old_token: str,
     device_info: str | None = None,
     ip_address: str | None = None,
-) -> tuple[str, uuid.UUID] | None:
-    """Rotate refresh token - revoke old, create new. Returns (new_token, user_id)."""
-    old_record = await validate_refresh_token(db, old_token)
+) -> tuple[str, User] | None:
+    """Rotate refresh token - revoke old, create new. Returns (new_token, user)."""
+    old_record = await validate_refresh_token(db, old_token, with_user=True)
     if not old_record:
         return None
 
@@ -119,7 +129,7 @@ async def rotate_refresh_token(
         ip_address=ip_address,
     )
 
-    return new_token, old_record.user_id
+    return new_token, old_record.user
 
 
 async def revoke_refresh_token(db: AsyncSession, token: str) -> bool:
@@ -138,7 +148,7 @@ async def revoke_all_user_tokens(db: AsyncSession, user_id: uuid.UUID) -> int:
         select(RefreshToken).where(
             and_(
                 RefreshToken.user_id == user_id,
-                not RefreshToken.is_revoked,
+                RefreshToken.is_revoked.is_(False),
             )
         )
     )
@@ -3,6 +3,9 @@
 import os
 from functools import lru_cache
 
+# Accepted spellings for boolean environment flags
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
 
 def read_secret(name: str, default: str = "") -> str:
     """Read secret from Docker secrets or environment variable."""
@@ -17,8 +20,8 @@ class Settings:
     """Application settings."""
 
     # Environment
-    TESTING: bool = os.getenv("TESTING", "").lower() in ("1", "true", "yes")
-    MOCK_OAUTH_ENABLED: bool = os.getenv("MOCK_OAUTH_ENABLED", "").lower() in ("1", "true", "yes")
+    TESTING: bool = os.getenv("TESTING", "").lower() in _TRUTHY
+    MOCK_OAUTH_ENABLED: bool = os.getenv("MOCK_OAUTH_ENABLED", "").lower() in _TRUTHY
 
     # Database
     DATABASE_URL: str = os.getenv(
@@ -8,7 +8,9 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.accounts import router as accounts_router
+from app.audit import AuditLogger
 from app.auth import router as auth_router
+from app.auth.oauth import close_http_client
 from app.auth.rate_limit import limiter
 from app.config import get_settings
 from app.db.session import async_session_factory
@@ -38,11 +40,16 @@ async def lifespan(app: FastAPI):
     _webhook_worker = WebhookWorker(db_session_factory=async_session_factory)
     await _webhook_worker.start()
 
+    # Start batched audit log writer
+    await AuditLogger.start(async_session_factory)
+
     yield
 
     # Cleanup on shutdown
     if _webhook_worker:
         await _webhook_worker.stop()
+    await AuditLogger.stop()
+    await close_http_client()
     await close_valkey()
 
 
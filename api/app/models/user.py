@@ -91,6 +91,7 @@ class UserProfile(Base):
         String(500),
         nullable=True,
     )
+    # Set by the ORM on update; trg_touch_user_profiles (migration 008) covers other writers
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
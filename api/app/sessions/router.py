@@ -7,9 +7,9 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.jwt import get_current_user
+from app.auth.jwt import CurrentUser, get_current_user
 from app.db.session import get_db
-from app.models import RefreshToken, User
+from app.models import RefreshToken
 
 from .schemas import RevokeResponse, SessionListResponse, SessionResponse
 
@@ -18,7 +18,7 @@ router = APIRouter(prefix="/sessions", tags=["sessions"])
 
 @router.get("", response_model=SessionListResponse)
 async def list_sessions(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """List all active sessions for current user."""
@@ -54,7 +54,7 @@ async def list_sessions(
 @router.delete("/{session_id}", response_model=RevokeResponse)
 async def revoke_session(
     session_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Revoke a specific session."""
@@ -83,7 +83,7 @@ async def revoke_session(
 
 @router.delete("", response_model=RevokeResponse)
 async def revoke_all_sessions(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Revoke all sessions for current user."""
@@ -1,18 +1,20 @@
 """User management router."""
 
-import json
 from datetime import UTC, datetime, timedelta
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
+from app.accounts.router import SUPPORTED_PROVIDERS
 from app.audit import AuditLogger, AuthEventType
-from app.auth.jwt import get_current_user
+from app.auth.jwt import CurrentUser, get_current_user
 from app.config import get_settings
 from app.db.session import get_db
 from app.models import DeletedUser, OAuthAccount, User, UserProfile
+from app.valkey import LinkedAccountsCache, UserCache
 from app.webhooks.emitter import WebhookEmitter
 
 from .schemas import SyncFromProviderResponse, UserDeleteResponse, UserResponse, UserUpdateRequest
@@ -26,14 +28,14 @@ SOFT_DELETE_GRACE_DAYS = 30
 
 def _get_client_info(request: Request) -> tuple[str | None, str | None]:
     """Extract device info and IP address from request."""
-    device_info = request.headers.get("User-Agent")
+    device_info = request.headers.get("user-agent")
     ip_address = request.client.host if request.client else None
     return device_info, ip_address
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get current user profile with OAuth accounts."""
@@ -43,6 +45,7 @@ async def get_current_user_profile(
             selectinload(User.profile),
             selectinload(User.emails),
             selectinload(User.oauth_accounts),
+            raiseload("*"),
         )
         .where(User.id == current_user.id)
     )
@@ -54,7 +57,7 @@ async def get_current_user_profile(
 async def update_profile(
     request: Request,
     update_data: UserUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Update current user profile."""
@@ -94,6 +97,7 @@ async def update_profile(
         user.profile.avatar_url = update_data.avatar_url
 
     await db.commit()
+    await UserCache.delete(str(user.id))
 
     # Log profile update
     if changes:
@@ -129,7 +133,7 @@ async def update_profile(
 @router.delete("/me", response_model=UserDeleteResponse)
 async def delete_account(
     request: Request,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Soft delete current user account.
@@ -182,13 +186,15 @@ async def delete_account(
         email_backup=email,
         display_name_backup=display_name,
         purge_at=datetime.now(UTC) + timedelta(days=SOFT_DELETE_GRACE_DAYS),
-        oauth_providers=json.dumps(oauth_providers) if oauth_providers else None,
+        oauth_providers=orjson.dumps(oauth_providers).decode() if oauth_providers else None,
     )
     db.add(deleted_user)
 
     # Delete user (cascades to profile, emails, oauth_accounts, refresh_tokens)
     await db.delete(user)
     await db.commit()
+    await UserCache.delete(str(user_id))
+    await LinkedAccountsCache.delete(user_id)
 
     return UserDeleteResponse(
         message=f"Account scheduled for deletion. Will be permanently removed after {SOFT_DELETE_GRACE_DAYS} days.",
@@ -201,7 +207,7 @@ async def delete_account(
 async def sync_profile_from_provider(
     request: Request,
     provider: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Sync user profile from OAuth provider.
@@ -211,7 +217,7 @@ async def sync_profile_from_provider(
     """
     device_info, ip_address = _get_client_info(request)
 
-    if provider not in ["google", "discord"]:
+    if provider not in SUPPORTED_PROVIDERS:
         raise HTTPException(status_code=400, detail="Unsupported provider")
 
     # Find OAuth account for this provider
@@ -254,6 +260,7 @@ async def sync_profile_from_provider(
         updated_fields.append("avatar_url")
 
     await db.commit()
+    await UserCache.delete(str(user.id))
 
     # Log profile sync
     await AuditLogger.log_event(
@@ -1,7 +1,9 @@
-"""Valkey (Redis-compatible) client for OAuth state management."""
+"""Valkey (Redis-compatible) client for OAuth state management and caching."""
 
-import json
+from collections.abc import Awaitable, Callable
+from typing import Any
 
+import orjson
 import redis.asyncio as redis
 
 from app.config import get_settings
@@ -34,7 +36,12 @@ async def close_valkey():
 class OAuthStateStore:
     """OAuth state management using Valkey."""
 
-    PREFIX = "oauth_state:"
+    PREFIX = b"oauth_state:"
+
+    @classmethod
+    def _key(cls, state: str) -> bytes:
+        # redis-py sends bytes keys as-is instead of encoding a new str per call
+        return cls.PREFIX + state.encode()
 
     @classmethod
     async def save(
@@ -50,9 +57,9 @@ class OAuthStateStore:
             data["code_verifier"] = code_verifier
 
         await client.setex(
-            f"{cls.PREFIX}{state}",
+            cls._key(state),
             settings.OAUTH_STATE_TTL,
-            json.dumps(data),
+            orjson.dumps(data),
         )
 
     @classmethod
@@ -60,30 +67,99 @@ class OAuthStateStore:
         """Save OAuth state with custom data."""
         client = await get_valkey()
         await client.setex(
-            f"{cls.PREFIX}{state}",
+            cls._key(state),
             settings.OAUTH_STATE_TTL,
-            json.dumps(data),
+            orjson.dumps(data),
         )
 
     @classmethod
     async def get_and_delete(cls, state: str) -> dict | None:
         """Get and delete OAuth state (one-time use)."""
         client = await get_valkey()
-        key = f"{cls.PREFIX}{state}"
-
-        # Get and delete atomically using pipeline
-        pipe = client.pipeline()
-        pipe.get(key)
-        pipe.delete(key)
-        results = await pipe.execute()
 
-        data = results[0]
+        # GETDEL fetches and removes in one atomic command (Valkey / Redis 6.2+)
+        data = await client.getdel(cls._key(state))
         if data:
-            return json.loads(data)
+            return orjson.loads(data)
         return None
 
     @classmethod
     async def exists(cls, state: str) -> bool:
         """Check if state exists."""
         client = await get_valkey()
-        return await client.exists(f"{cls.PREFIX}{state}") > 0
+        return await client.exists(cls._key(state)) > 0
+
+
+class ResponseCache:
+    """Short-lived cache for JSON-serializable API responses."""
+
+    PREFIX = "cache:"
+
+    @classmethod
+    async def get_or_set(
+        cls,
+        key: str,
+        ttl: int,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached value for key, or load, store and return it."""
+        client = await get_valkey()
+        cached = await client.get(f"{cls.PREFIX}{key}")
+        if cached is not None:
+            return orjson.loads(cached)
+
+        value = await loader()
+        await client.setex(f"{cls.PREFIX}{key}", ttl, orjson.dumps(value))
+        return value
+
+    @classmethod
+    async def delete(cls, key: str) -> None:
+        """Invalidate a cached value."""
+        client = await get_valkey()
+        await client.delete(f"{cls.PREFIX}{key}")
+
+
+class LinkedAccountsCache:
+    """Cached GET /accounts listings, invalidated whenever a user's links change."""
+
+    TTL = 30
+
+    @staticmethod
+    def _key(user_id) -> str:
+        return f"accts:{user_id}"
+
+    @classmethod
+    async def get_or_set(cls, user_id, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached listing for a user, or load and cache it."""
+        return await ResponseCache.get_or_set(cls._key(user_id), cls.TTL, loader)
+
+    @classmethod
+    async def delete(cls, user_id) -> None:
+        """Invalidate a user's cached listing."""
+        await ResponseCache.delete(cls._key(user_id))
+
+
+class UserCache:
+    """Short-lived cache of authenticated user snapshots."""
+
+    PREFIX = "user:"
+    TTL = 60
+
+    @classmethod
+    async def get(cls, user_id: str) -> dict | None:
+        """Get a cached user snapshot."""
+        client = await get_valkey()
+        data = await client.get(f"{cls.PREFIX}{user_id}")
+        return orjson.loads(data) if data else None
+
+    @classmethod
+    async def set(cls, user_id: str, data: dict, ttl: int = TTL) -> None:
+        """Cache a user snapshot with TTL."""
+        client = await get_valkey()
+        await client.setex(f"{cls.PREFIX}{user_id}", ttl, orjson.dumps(data))
+
+    @classmethod
+    async def delete(cls, user_id: str) -> None:
+        """Invalidate a cached user snapshot."""
+        client = await get_valkey()
+        await client.delete(f"{cls.PREFIX}{user_id}")
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import uuid
 from typing import Any
 
+import orjson
+
 from app.valkey import get_valkey
 from app.webhooks.config import WebhookConfigLoader
 from app.webhooks.event import WebhookEvent
@@ -56,7 +57,7 @@ class WebhookEmitter:
             client = await get_valkey()
             await client.rpush(
                 WEBHOOK_QUEUE_KEY,
-                json.dumps(event.to_payload()),
+                orjson.dumps(event.to_payload()),
             )
             logger.info(
                 "Queued webhook event %s (type: %s) for %d endpoint(s)",
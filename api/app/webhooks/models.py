@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from enum import StrEnum
 
-from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy import DateTime, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -29,7 +29,7 @@ class WebhookDelivery(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
     )
     event_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -76,10 +76,10 @@ class WebhookDelivery(Base):
         Integer,
         nullable=True,
     )
+    # Partition key; the table is range-partitioned by month (migration 009)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        index=True,
     )
     completed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
@@ -3,15 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
-import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 import httpx
+import orjson
 
 from app.valkey import get_valkey
 from app.webhooks.config import WebhookConfigLoader, WebhookEndpoint
@@ -96,9 +95,9 @@ class WebhookWorker:
         _, event_json = result
 
         try:
-            payload = json.loads(event_json)
+            payload = orjson.loads(event_json)
             event = WebhookEvent.from_payload(payload)
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (orjson.JSONDecodeError, KeyError, ValueError) as e:
             logger.error("Failed to parse webhook event: %s", e)
             return
 
@@ -185,7 +184,7 @@ class WebhookWorker:
         # Build payload with webhook_id
         payload_dict = event.to_payload()
         payload_dict["webhook_id"] = endpoint.id
-        payload_json = json.dumps(payload_dict)
+        payload_json = orjson.dumps(payload_dict).decode()
 
         # Generate headers with signature
         headers = WebhookSigner.get_headers(
@@ -247,7 +246,6 @@ class WebhookWorker:
 
             async with self._db_session_factory() as session:
                 delivery = WebhookDelivery(
-                    id=uuid.uuid4(),
                     event_id=event.event_id,
                     event_type=event.event_type,
                     endpoint_id=endpoint.id,
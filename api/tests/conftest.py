@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
@@ -72,6 +73,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     # Mock Valkey client
     mock_redis = AsyncMock()
     mock_redis.get.return_value = None
+    mock_redis.getdel.return_value = None
     mock_redis.setex.return_value = True
     mock_redis.delete.return_value = True
     mock_redis.exists.return_value = 0
@@ -88,6 +90,28 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def count_queries(db_engine):
+    """List that collects every SQL statement run against the test engine."""
+    statements: list[str] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", on_execute)
+    yield statements
+    event.remove(db_engine.sync_engine, "before_cursor_execute", on_execute)
+
+
+@pytest.fixture
+def no_rate_limit():
+    """Disable slowapi limits, whose storage is a real Valkey connection."""
+    from app.auth.rate_limit import limiter
+
+    with patch.object(limiter, "enabled", False):
+        yield
+
+
 @pytest.fixture
 def mock_oauth_user():
     """Mock OAuth user data."""
@@ -0,0 +1,177 @@
+"""Tests for AuditLogger batched writes."""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.audit import AuditLogger, AuthEventType
+from app.audit.service import _EVENT_INSERT, _LOGIN_INSERT
+
+
+@pytest.fixture
+def audit_session():
+    """Session mock handed out by a fake session factory."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def session_factory(audit_session):
+    """Async session factory yielding the mocked session."""
+
+    @asynccontextmanager
+    async def factory():
+        yield audit_session
+
+    return factory
+
+
+@pytest.fixture(autouse=True)
+def enable_audit():
+    """Audit logging is skipped under TESTING; enable it for these tests."""
+    with patch("app.audit.service._is_testing", return_value=False):
+        yield
+
+
+class TestAuditLoggerBatching:
+    """Tests for the background batch writer."""
+
+    @pytest.mark.asyncio
+    async def test_queued_records_written_in_batches(self, session_factory, audit_session):
+        """Records logged while the writer runs are written with one execute per table."""
+        request_db = AsyncMock()
+        user_id = uuid.uuid4()
+
+        await AuditLogger.start(session_factory)
+        try:
+            for _ in range(3):
+                await AuditLogger.log_login(request_db, user_id, "google", True)
+            await AuditLogger.log_event(
+                request_db, AuthEventType.LOGIN_SUCCESS, user_id, {"provider": "google"}
+            )
+            await AuditLogger.log_event(request_db, AuthEventType.LOGOUT, user_id)
+        finally:
+            await AuditLogger.stop()
+
+        # Request session is never touched on the hot path
+        request_db.execute.assert_not_called()
+        request_db.commit.assert_not_called()
+
+        batches = [call.args[1] for call in audit_session.execute.call_args_list]
+        assert sum(len(b) for b in batches) == 5
+        assert audit_session.execute.call_count == 2
+        assert audit_session.commit.call_count == 2
+
+        events = next(b for b in batches if "event_type" in b[0])
+        assert events[0]["details"] == '{"provider":"google"}'
+        assert events[1]["details"] is None
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_batch_held_by_writer(self, session_factory, audit_session):
+        """Records the writer already took off the queue are written on stop."""
+        request_db = AsyncMock()
+
+        await AuditLogger.start(session_factory)
+        try:
+            await AuditLogger.log_login(request_db, None, "google", True)
+            # Let the writer pick the record up and wait for more
+            await asyncio.sleep(0.01)
+            assert AuditLogger._queue.empty()
+        finally:
+            await AuditLogger.stop()
+
+        audit_session.execute.assert_called_once()
+        assert audit_session.execute.call_args.args[1][0]["provider"] == "google"
+
+    @pytest.mark.asyncio
+    async def test_failed_event_insert_keeps_logins(self, session_factory, audit_session):
+        """Each audit table is committed on its own."""
+        audit_session.execute.side_effect = [
+            None,
+            RuntimeError("bad event row"),
+            RuntimeError("bad event row"),
+        ]
+
+        with patch.object(AuditLogger, "_db_session_factory", session_factory):
+            await AuditLogger._write_batch(
+                [
+                    ("login", {"provider": "google"}),
+                    ("event", {"event_type": "logout", "details": None}),
+                ]
+            )
+
+        audit_session.commit.assert_called_once()
+        assert audit_session.execute.call_args_list[0].args[1] == [{"provider": "google"}]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_single_rows(self, session_factory, audit_session):
+        """A failed batch is retried row by row so only the bad record is lost."""
+        audit_session.execute.side_effect = [
+            RuntimeError("batch failed"),
+            RuntimeError("bad login row"),
+            None,
+        ]
+
+        with patch.object(AuditLogger, "_db_session_factory", session_factory):
+            await AuditLogger._write_batch(
+                [
+                    ("login", {"provider": "bad"}),
+                    ("login", {"provider": "google"}),
+                ]
+            )
+
+        assert audit_session.execute.call_count == 3
+        assert audit_session.execute.call_args_list[2].args[1] == [{"provider": "google"}]
+        audit_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_writes_directly_without_writer(self):
+        """Without a running writer the caller's session is used."""
+        request_db = AsyncMock()
+
+        await AuditLogger.log_login(request_db, None, "github", False, failure_reason="x")
+
+        request_db.execute.assert_called_once()
+        request_db.commit.assert_called_once()
+        assert request_db.execute.call_args.args[1]["provider"] == "github"
+
+    @pytest.mark.asyncio
+    async def test_full_queue_falls_back_to_direct_write(self, session_factory):
+        """Records are written with the caller's session rather than dropped."""
+        request_db = AsyncMock()
+
+        with patch("app.audit.service.AUDIT_QUEUE_MAXSIZE", 1):
+            await AuditLogger.start(session_factory)
+        try:
+            # Nothing yields between the calls, so the writer can't drain the first
+            await AuditLogger.log_login(request_db, None, "google", True)
+            await AuditLogger.log_login(request_db, None, "github", True)
+        finally:
+            await AuditLogger.stop()
+
+        request_db.execute.assert_called_once()
+        assert request_db.execute.call_args.args[1]["provider"] == "github"
+
+
+class TestAuditStatements:
+    """Tests for the raw audit INSERT statements."""
+
+    def test_every_column_is_a_bind_parameter(self):
+        """Casts must not hide a placeholder from text() parameter parsing."""
+        assert set(_EVENT_INSERT.compile().params) == {
+            "user_id",
+            "event_type",
+            "details",
+            "ip_address",
+            "user_agent",
+        }
+        assert set(_LOGIN_INSERT.compile().params) == {
+            "user_id",
+            "provider",
+            "ip_address",
+            "user_agent",
+            "success",
+            "failure_reason",
+        }
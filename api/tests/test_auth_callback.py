@@ -0,0 +1,193 @@
+"""Tests for the shared OAuth login/callback handlers."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.auth.router import PROVIDERS, _find_or_create_user
+
+
+@pytest.fixture(autouse=True)
+def _no_rate_limit(no_rate_limit):
+    """Provider routes are rate limited; run them without Valkey."""
+
+
+class TestOAuthCallback:
+    """Tests for provider callback routes."""
+
+    def test_every_provider_has_routes(self):
+        """Test that each provider in the table is registered."""
+        assert set(PROVIDERS) == {
+            "google",
+            "discord",
+            "github",
+            "x",
+            "linkedin",
+            "facebook",
+            "slack",
+            "twitch",
+        }
+
+    @pytest.mark.asyncio
+    async def test_callback_rejects_unknown_state(self, client):
+        """Test that a missing or expired state is rejected."""
+        response = await client.get("/api/v1/auth/google/callback?code=abc&state=missing")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid or expired state"
+
+    @pytest.mark.asyncio
+    async def test_callback_rejects_state_for_other_provider(self, client):
+        """Test that a state issued for one provider can't complete another."""
+        state_data = {"provider": "github", "code_verifier": "verifier"}
+        with patch(
+            "app.auth.router.OAuthStateStore.get_and_delete",
+            AsyncMock(return_value=state_data),
+        ):
+            response = await client.get("/api/v1/auth/google/callback?code=abc&state=s")
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_callback_signs_in_user(self, client, respx_mock):
+        """Test that a valid callback creates the user and redirects with tokens."""
+        respx_mock.post("https://oauth2.googleapis.com/token").mock(
+            return_value=httpx.Response(200, json={"access_token": "google-token"})
+        )
+        respx_mock.get("https://www.googleapis.com/oauth2/v2/userinfo").mock(
+            return_value=httpx.Response(
+                200,
+                json={"id": "g-123", "email": "callback@example.com", "name": "Callback User"},
+            )
+        )
+        state_data = {"provider": "google", "code_verifier": "verifier"}
+
+        with patch(
+            "app.auth.router.OAuthStateStore.get_and_delete",
+            AsyncMock(return_value=state_data),
+        ):
+            response = await client.get("/api/v1/auth/google/callback?code=abc&state=s")
+
+        assert response.status_code == 302
+        assert response.headers["cache-control"] == "no-store"
+        assert response.headers["referrer-policy"] == "no-referrer"
+        assert "access_token=" in response.headers["location"]
+        assert "refresh_token=" in response.headers["location"]
+
+    @pytest.mark.asyncio
+    async def test_repeat_login_reuses_linked_user(self, client):
+        """Test that a second login through the same account signs in the same user."""
+        first = await client.get("/api/v1/auth/mock/login?user=alice&provider=google")
+        second = await client.get("/api/v1/auth/mock/login?user=alice&provider=google")
+
+        assert first.status_code == second.status_code == 200
+        assert first.json()["user_id"] == second.json()["user_id"]
+
+    @pytest.mark.asyncio
+    async def test_callback_rejects_malformed_user_info(self, client, respx_mock):
+        """Test that a userinfo payload missing required fields is a 400, not a 500."""
+        respx_mock.post("https://oauth2.googleapis.com/token").mock(
+            return_value=httpx.Response(200, json={"access_token": "google-token"})
+        )
+        respx_mock.get("https://www.googleapis.com/oauth2/v2/userinfo").mock(
+            return_value=httpx.Response(200, json={"id": "g-123", "name": "No Email"})
+        )
+        state_data = {"provider": "google", "code_verifier": "verifier"}
+
+        with patch(
+            "app.auth.router.OAuthStateStore.get_and_delete",
+            AsyncMock(return_value=state_data),
+        ):
+            response = await client.get("/api/v1/auth/google/callback?code=abc&state=s")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Failed to get user info"
+
+    @pytest.mark.asyncio
+    async def test_login_with_new_provider_links_by_email(self, client):
+        """Test that a second provider with the same email is linked to the existing user."""
+        first = await client.get("/api/v1/auth/mock/login?user=alice&provider=google")
+        second = await client.get("/api/v1/auth/mock/login?user=alice&provider=github")
+
+        assert first.status_code == second.status_code == 200
+        assert first.json()["user_id"] == second.json()["user_id"]
+
+    @pytest.mark.asyncio
+    async def test_linking_by_email_invalidates_account_listing(self, client):
+        """Test that linking a new provider drops the cached GET /accounts listing."""
+        first = await client.get("/api/v1/auth/mock/login?user=alice&provider=google")
+
+        with patch("app.auth.router.LinkedAccountsCache.delete", AsyncMock()) as invalidate:
+            await client.get("/api/v1/auth/mock/login?user=alice&provider=github")
+
+        invalidate.assert_awaited_once()
+        assert str(invalidate.call_args.args[0]) == first.json()["user_id"]
+
+    @pytest.mark.asyncio
+    async def test_linking_by_email_invalidates_user_snapshot(self, client):
+        """Test that linking a new provider drops the cached user snapshot."""
+        first = await client.get("/api/v1/auth/mock/login?user=alice&provider=google")
+
+        with patch("app.auth.router.UserCache.delete", AsyncMock()) as invalidate:
+            await client.get("/api/v1/auth/mock/login?user=alice&provider=github")
+
+        invalidate.assert_awaited_once_with(first.json()["user_id"])
+
+    @pytest.mark.asyncio
+    async def test_returning_login_invalidates_account_listing(self, client):
+        """Test that refreshing a linked account's provider info drops the cached listing."""
+        first = await client.get("/api/v1/auth/mock/login?user=alice&provider=google")
+
+        with patch("app.auth.router.LinkedAccountsCache.delete", AsyncMock()) as invalidate:
+            await client.get("/api/v1/auth/mock/login?user=alice&provider=google")
+
+        invalidate.assert_awaited_once()
+        assert str(invalidate.call_args.args[0]) == first.json()["user_id"]
+
+
+class TestFindOrCreateUser:
+    """Tests for the account lookup behind every login."""
+
+    @pytest.mark.asyncio
+    async def test_returning_login_runs_two_statements(self, db_session, count_queries):
+        """Test that an existing account is refreshed and loaded in two statements."""
+        account = {
+            "provider": "google",
+            "provider_user_id": "g-1",
+            "email": "repeat@example.com",
+            "display_name": "Repeat",
+            "avatar_url": None,
+            "access_token": "a",
+            "refresh_token": None,
+        }
+        created = await _find_or_create_user(db_session, **account)
+        db_session.expunge_all()
+        count_queries.clear()
+
+        with patch("app.auth.router.LinkedAccountsCache.delete", AsyncMock()):
+            user = await _find_or_create_user(db_session, **account)
+
+        assert user.id == created.id
+        assert user.email == "repeat@example.com"
+        assert len(count_queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_new_user_is_not_reloaded(self, db_session, count_queries):
+        """Test that signup returns the inserted user without selecting it again."""
+        user = await _find_or_create_user(
+            db_session,
+            provider="github",
+            provider_user_id="gh-1",
+            email="new@example.com",
+            display_name="New User",
+            avatar_url=None,
+            access_token="a",
+            refresh_token=None,
+        )
+
+        assert user.email == "new@example.com"
+        assert user.display_name == "New User"
+        # The only SELECT is the email lookup that precedes the inserts
+        selects = [s for s in count_queries if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 1
@@ -193,6 +193,14 @@ class TestMockOAuthFacebookFormat:
         assert "data" in facebook_format["picture"]
         assert "url" in facebook_format["picture"]["data"]
 
+    def test_to_facebook_format_is_read_only_throughout(self):
+        """Test that the shared format can't be mutated, nested picture included."""
+        facebook_format = get_mock_user("alice").to_facebook_format()
+
+        with pytest.raises(TypeError):
+            facebook_format["picture"]["data"]["url"] = "https://example.com/other.png"
+        assert get_mock_user("alice").to_facebook_format() is facebook_format
+
     def test_to_facebook_format_picture_structure(self):
         """Test that Facebook format has correct picture structure."""
         mock_user = MockOAuthUser(
@@ -138,6 +138,25 @@ class TestLinkedInOAuthExchangeCode:
 
             assert result is None
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body", [b"", b"<html>ok</html>"])
+    async def test_exchange_code_unreadable_success_body(self, respx_mock, body):
+        """Test that an empty or non-JSON 2xx body is treated as a failure."""
+        respx_mock.post("https://www.linkedin.com/oauth/v2/accessToken").mock(
+            return_value=httpx.Response(200 if body else 204, content=body)
+        )
+
+        with patch("app.auth.oauth.settings") as mock_settings:
+            mock_settings.LINKEDIN_CLIENT_ID = "test-client-id"
+            mock_settings.LINKEDIN_CLIENT_SECRET = "test-client-secret"
+
+            result = await LinkedInOAuth.exchange_code(
+                code="test-code",
+                redirect_uri="http://localhost:8000/callback",
+            )
+
+            assert result is None
+
 
 class TestLinkedInOAuthUserInfo:
     """Tests for LinkedIn OAuth user info retrieval."""
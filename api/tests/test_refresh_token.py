@@ -0,0 +1,32 @@
+"""Tests for refresh token rotation."""
+
+import pytest
+
+
+class TestRefreshTokenRotation:
+    """Tests for POST /auth/refresh."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_rotates_token(self, client, no_rate_limit):
+        """Test that a valid refresh token yields a new pair for the same user."""
+        login = (await client.get("/api/v1/auth/mock/login?user=alice")).json()
+
+        response = await client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": login["refresh_token"]}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["refresh_token"] != login["refresh_token"]
+        assert data["access_token"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_is_single_use(self, client, no_rate_limit):
+        """Test that a rotated refresh token can't be used again."""
+        login = (await client.get("/api/v1/auth/mock/login?user=bob")).json()
+        body = {"refresh_token": login["refresh_token"]}
+
+        await client.post("/api/v1/auth/refresh", json=body)
+        response = await client.post("/api/v1/auth/refresh", json=body)
+
+        assert response.status_code == 401
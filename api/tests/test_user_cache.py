@@ -0,0 +1,84 @@
+"""Tests for the get_current_user Valkey cache."""
+
+import dataclasses
+import json
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.auth.jwt import CurrentUser, _user_from_cache, _user_to_cache, get_current_user
+from app.auth.tokens import create_access_token
+from app.models import User, UserEmail, UserProfile
+
+
+@pytest.fixture
+def mock_valkey():
+    """Valkey client mock patched into app.valkey."""
+    client = AsyncMock()
+    client.get.return_value = None
+
+    async def mock_get_valkey():
+        return client
+
+    with patch("app.valkey.get_valkey", mock_get_valkey):
+        yield client
+
+
+def _make_user() -> User:
+    user_id = uuid.uuid4()
+    user = User(id=user_id, created_at=datetime(2026, 1, 1, tzinfo=UTC))
+    user.profile = UserProfile(user_id=user_id, display_name="Test", avatar_url=None)
+    user.emails = [
+        UserEmail(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            email="test@example.com",
+            is_primary=True,
+            verified_at=datetime(2026, 1, 2, tzinfo=UTC),
+        )
+    ]
+    return user
+
+
+class TestUserCache:
+    """Tests for user snapshot caching."""
+
+    def test_snapshot_round_trip(self):
+        """A cached snapshot rebuilds the same user, profile and emails."""
+        user = _make_user()
+
+        restored = _user_from_cache(json.loads(json.dumps(_user_to_cache(user))))
+
+        assert restored.id == user.id
+        assert restored.created_at == user.created_at
+        assert restored.display_name == "Test"
+        assert restored.email == "test@example.com"
+        assert restored.emails[0].verified_at == user.emails[0].verified_at
+
+    def test_snapshot_is_not_an_orm_instance(self):
+        """A cached snapshot is a frozen CurrentUser, not a detached User."""
+        restored = _user_from_cache(_user_to_cache(_make_user()))
+
+        assert isinstance(restored, CurrentUser)
+        assert not isinstance(restored, User)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            restored.display_name = "Changed"
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_database(self, mock_valkey):
+        """get_current_user serves cached users without querying the database."""
+        user = _make_user()
+        mock_valkey.get.return_value = json.dumps(_user_to_cache(user))
+        db = AsyncMock()
+        token = create_access_token(str(user.id), "test@example.com")
+
+        result = await get_current_user(
+            HTTPAuthorizationCredentials(scheme="Bearer", credentials=token), db
+        )
+
+        assert result.id == user.id
+        assert result.email == "test@example.com"
+        db.execute.assert_not_called()
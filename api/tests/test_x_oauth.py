@@ -107,6 +107,26 @@ class TestXOAuthExchangeCode:
 
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_exchange_code_uses_basic_auth(self, respx_mock):
+        """Test that client credentials are sent as HTTP Basic auth."""
+        route = respx_mock.post("https://api.twitter.com/2/oauth2/token").mock(
+            return_value=httpx.Response(200, json={"access_token": "test_access_token"})
+        )
+
+        with patch("app.auth.oauth.settings") as mock_settings:
+            mock_settings.X_CLIENT_ID = "test-client-id"
+            mock_settings.X_CLIENT_SECRET = "test-client-secret"
+
+            await XOAuth.exchange_code(
+                code="test-code",
+                redirect_uri="http://localhost:8000/callback",
+                code_verifier="test-verifier",
+            )
+
+        auth = route.calls.last.request.headers["Authorization"]
+        assert auth == "Basic dGVzdC1jbGllbnQtaWQ6dGVzdC1jbGllbnQtc2VjcmV0"
+
 
 class TestXOAuthUserInfo:
     """Tests for X OAuth user info retrieval."""